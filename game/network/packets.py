@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from typing import Any, Dict
 
 # ------------------------------------------------------------
@@ -43,6 +44,13 @@ DOCK_ACTION = "DOCK_ACTION"
 # ENCODING / DECODING
 # ------------------------------------------------------------
 
+def _json_default(obj: Any) -> Any:
+    """Encode read-only mapping views (e.g. MappingProxyType) as objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def encode_packet(packet_type: str, payload: Dict[str, Any]) -> str:
     """
     Serialize a packet dictionary to a compact JSON string.
@@ -63,7 +71,9 @@ def encode_packet(packet_type: str, payload: Dict[str, Any]) -> str:
         raise ValueError("payload must be a dictionary")
 
     packet = {"type": packet_type, "payload": payload}
-    return json.dumps(packet, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(
+        packet, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    )
 
 
 def decode_packet(raw_json: str) -> Dict[str, Any]:
@@ -11,7 +11,7 @@ from websockets.server import WebSocketServerProtocol, serve
 
 from game.world.galaxy import Galaxy
 from game.world.port import Port
-from game.world.stardock import stardock_process_action
+from game.world.stardock import ensure_player_defaults, stardock_process_action
 from game.network.packets import (
     CHAT_MESSAGE,
     HEARTBEAT_PING,
@@ -44,8 +44,8 @@ os.makedirs(SAVE_DIR, exist_ok=True)
 def save_galaxy(galaxy: Galaxy) -> None:
     """Save galaxy state to disk."""
     path = os.path.join(SAVE_DIR, "galaxy.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(galaxy.to_dict(), f, indent=2)
+    with open(path, "wb") as f:
+        f.write(galaxy.to_json_bytes())
     print("[AUTO-SAVE] Galaxy saved.")
 
 
@@ -56,11 +56,11 @@ def load_galaxy() -> Galaxy:
         print("[LOAD] No saved galaxy found — generating new one.")
         return Galaxy(200)
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        buf = f.read()
 
     print(f"[LOAD] Loaded galaxy from {path}")
-    return Galaxy.from_dict(data)
+    return Galaxy.from_json_bytes(buf)
 
 
 def save_players(state: Dict[str, Dict[str, Any]]) -> None:
@@ -159,8 +159,8 @@ def _do_trade(player_id: str, action: str, good: str, amount: int) -> Dict[str,
             "port": None,
         }
 
-    prices = sector.port.prices
-    if good not in prices:
+    price_per = sector.port.get_price(good)
+    if price_per is None:
         return {
             "success": False,
             "message": f"Port does not trade '{good}'.",
@@ -185,8 +185,6 @@ def _do_trade(player_id: str, action: str, good: str, amount: int) -> Dict[str,
             "port": sector.port.to_dict(),
         }
 
-    price_per = prices[good]
-
     if action == "INFO":
         return {
             "success": True,
@@ -350,6 +348,9 @@ async def handle_connection(websocket: WebSocketServerProtocol, path: str) -> No
         "shields": 10,    # Required for stardock upgrades
         "bank": 0,        # Required for stardock banking
     }
+    # Fill any other field the stardock services rely on, so DOCK_ACTION
+    # is safe even if the client never sent DOCK_REQUEST
+    ensure_player_defaults(player_state[player_id])
 
     print(f"[SERVER] Player connected: {player_id}")
 
@@ -529,13 +530,13 @@ async def handle_connection(websocket: WebSocketServerProtocol, path: str) -> No
                     )
                     
                     # Save player state if action was successful
-                    if result.get("success"):
+                    if result.success:
                         save_players(player_state)
                     
                     # Return result with player state update
                     await websocket.send(encode_packet(
                         DOCK_ACTION,
-                        result
+                        result.to_dict()
                     ))
                 
                 continue
@@ -33,7 +33,31 @@ def load_galaxy(path=None):
     
     print(f"✓ Loading from: {os.path.abspath(path)}")
     with open(path, 'r') as f:
-        return json.load(f)
+        return expand_compact(json.load(f))
+
+
+def expand_compact(galaxy_data):
+    """Convert a compact (version 2) save into the per-sector layout used here."""
+    if galaxy_data.get('version') != 2:
+        return galaxy_data
+
+    off = galaxy_data['csr_off']
+    flat = galaxy_data['csr_flat']
+    ports = galaxy_data.get('ports', {})
+    planets = galaxy_data.get('planets', {})
+    stardocks = set(galaxy_data.get('stardocks', []))
+
+    sectors = {}
+    for sid in range(1, galaxy_data['size'] + 1):
+        key = str(sid)
+        sectors[key] = {
+            'id': sid,
+            'neighbors': flat[off[sid - 1]:off[sid]],
+            'port': ports.get(key),
+            'planet': planets.get(key),
+            'stardock': sid in stardocks,
+        }
+    return {'size': galaxy_data['size'], 'sectors': sectors}
 
 
 def show_statistics(galaxy_data):
@@ -11,7 +11,8 @@ Features:
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import signal
+from typing import Any, Dict, List, Optional, Tuple
 
 import websockets
 from blessed import Terminal
@@ -40,6 +41,77 @@ from game.network.packets import (
 term = Terminal()
 
 
+def _decode_batch(raws: List[str]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Decode a batch of raw frames, dropping heartbeats (runs off-loop).
+
+    A malformed frame is skipped on its own so it can't take the rest of
+    the batch down with it; the number skipped is returned alongside the
+    decoded packets.
+    """
+    packets = []
+    bad = 0
+    for raw in raws:
+        try:
+            p = decode_packet(raw)
+        except ValueError:
+            bad += 1
+            continue
+        if not is_heartbeat(p):
+            packets.append(p)
+    return packets, bad
+
+
+# Dirty-region flags: each bit marks a part of the screen that must be
+# repainted on the next frame.  DIRTY_ALL forces a full clear + redraw.
+DIRTY_STATUS = 1 << 0
+DIRTY_NAV = 1 << 1
+DIRTY_COMM = 1 << 2
+DIRTY_DOCK = 1 << 3
+DIRTY_INPUT = 1 << 4
+DIRTY_PANEL = 1 << 5  # active panel was drawn over (e.g. by an animation)
+DIRTY_ALL = (
+    DIRTY_STATUS | DIRTY_NAV | DIRTY_COMM | DIRTY_DOCK | DIRTY_INPUT | DIRTY_PANEL
+)
+
+# Which dirty bit invalidates each window's panel
+WINDOW_REGIONS: Dict[str, int] = {
+    "status": DIRTY_STATUS,
+    "ship": DIRTY_STATUS,
+    "nav": DIRTY_NAV,
+    "comm": DIRTY_COMM,
+    "comp": 0,
+}
+WINDOW_COMMANDS = frozenset(WINDOW_REGIONS)
+
+# Seconds between heartbeat pings
+HEARTBEAT_INTERVAL = 10
+
+# Frames in the scan sweep, independent of terminal width
+SCAN_ANIMATION_STEPS = 30
+
+# Dock-mode menu shortcuts -> DOCK_ACTION payload
+DOCK_MENU_COMMANDS: Dict[str, str] = {
+    **{n: n for n in ("0", "1", "2", "3", "4", "5")},
+    "leave": "0",
+    "exit": "0",
+    "undock": "0",
+}
+
+# First word of a named stardock service command (e.g. "bank_deposit")
+DOCK_SERVICE_PREFIXES = frozenset(
+    {"repair", "upgrade", "expand", "bank", "rusty", "gamble"}
+)
+
+# Map common aliases
+DOCK_ACTION_ALIASES: Dict[str, str] = {
+    "REPAIR": "REPAIR_HULL",
+    "UPGRADE": "UPGRADE_SHIELDS",
+    "EXPAND": "EXPAND_CARGO",
+    "GAMBLE": "RUSTY_GAMBLE",
+}
+
+
 class Theme:
     """Color scheme for terminal UI."""
     BORDER = term.bold_blue
@@ -52,6 +124,42 @@ class Theme:
     WARNING = term.bold_yellow
 
 
+class SectorView:
+    """
+    Fixed-schema view of the sector data the server sends.
+
+    Built once per SECTOR_UPDATE/SCAN_RESULT so renderers read attributes
+    instead of re-running dict lookups and fallbacks every frame.
+    """
+
+    __slots__ = ("sector_id", "warps", "stardock", "has_port", "port_name")
+
+    def __init__(
+        self,
+        sector_id: Optional[int] = None,
+        warps: Any = (),
+        stardock: bool = False,
+        has_port: bool = False,
+        port_name: Optional[str] = None,
+    ) -> None:
+        self.sector_id = sector_id
+        self.warps = warps
+        self.stardock = stardock
+        self.has_port = has_port
+        self.port_name = port_name
+
+    @classmethod
+    def from_data(cls, sd: Dict[str, Any], sector_id: Optional[int] = None) -> "SectorView":
+        """Normalize a serialized sector dict (neighbors or legacy warps)."""
+        return cls(
+            sector_id=sector_id,
+            warps=sd.get("neighbors") or sd.get("warps") or (),
+            stardock=bool(sd.get("stardock")),
+            has_port=bool(sd.get("has_port")),
+            port_name=sd.get("port_name"),
+        )
+
+
 class GameClient:
     """
     TradeWars 2025 game client with terminal interface.
@@ -59,6 +167,34 @@ class GameClient:
     Manages network communication, UI rendering, and user input.
     """
 
+    __slots__ = (
+        "uri",
+        "websocket",
+        "player_id",
+        "players",
+        "current_sector_id",
+        "current_sector_data",
+        "current_sector_view",
+        "messages",
+        "max_messages",
+        "current_input",
+        "active_window",
+        "animating",
+        "running",
+        "dirty",
+        "_w",
+        "_h",
+        "_recv_raw_q",
+        "_hb_frame",
+        "_dock_req_frame",
+        "_hb_handle",
+        "_hb_task",
+        "in_dock",
+        "dock_menu",
+        "dock_intro",
+        "_cmds",
+    )
+
     def __init__(self, uri: str = "ws://localhost:8765") -> None:
         """
         Initialize game client.
@@ -76,6 +212,7 @@ class GameClient:
         # Sector state
         self.current_sector_id: Optional[int] = None
         self.current_sector_data: Dict[str, Any] = {}
+        self.current_sector_view: SectorView = SectorView()
 
         # UI state
         self.messages: List[str] = []
@@ -84,13 +221,42 @@ class GameClient:
         self.active_window: str = "status"
         self.animating: bool = False
         self.running: bool = True
-        self.needs_redraw: bool = True
+        self.dirty: int = DIRTY_ALL
+
+        # Cached terminal size (refreshed on SIGWINCH)
+        self._w: int = term.width
+        self._h: int = term.height
+
+        # Raw frames awaiting batch decode (None marks connection close);
+        # created in run() so it binds to the running loop on 3.8/3.9
+        self._recv_raw_q: "Optional[asyncio.Queue[Optional[str]]]" = None
+
+        # Payload-less packets never change, so encode them once
+        self._hb_frame: str = encode_packet(HEARTBEAT_PING, {})
+        self._dock_req_frame: str = encode_packet(DOCK_REQUEST, {})
+
+        # Heartbeat timer (armed in run())
+        self._hb_handle: Optional[asyncio.TimerHandle] = None
+        self._hb_task: Optional[asyncio.Task] = None
 
         # Dock state
         self.in_dock: bool = False
         self.dock_menu: List[str] = []
         self.dock_intro: Optional[str] = None
 
+        # Normal-mode command dispatch, keyed by the first word
+        self._cmds = {
+            "quit": self._cmd_quit,
+            "exit": self._cmd_quit,
+            "q": self._cmd_quit,
+            "say": self._cmd_say,
+            "warp": self._cmd_warp,
+            "scan": self._cmd_scan,
+            "port": self._cmd_port,
+            "dock": self._cmd_dock,
+            "debug": self._cmd_debug,
+        }
+
     # ============================================================
     # NETWORK - SEND HELPERS
     # ============================================================
@@ -123,20 +289,29 @@ class GameClient:
 
     async def send_dock_request(self) -> None:
         """Request docking at stardock."""
-        await self.send(DOCK_REQUEST, {})
+        if self.websocket:
+            await self.websocket.send(self._dock_req_frame)
 
-    async def send_dock_action(self, action: str) -> None:
-        """Send stardock service action."""
-        await self.send(DOCK_ACTION, {"action": action})
+    async def send_dock_action(
+        self, action: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Send stardock service action, with any extra params (e.g. amount)."""
+        await self.send(DOCK_ACTION, {**(params or {}), "action": action})
 
     async def send_heartbeat(self) -> None:
         """Send heartbeat ping."""
-        await self.send(HEARTBEAT_PING, {})
+        if self.websocket:
+            await self.websocket.send(self._hb_frame)
 
     # ============================================================
     # UI - HELPER METHODS
     # ============================================================
 
+    def _on_resize(self, *_: Any) -> None:
+        """SIGWINCH loop callback: refresh cached terminal size and repaint."""
+        self._w, self._h = term.width, term.height
+        self.dirty = DIRTY_ALL
+
     def _me(self) -> Dict[str, Any]:
         """Get current player's state."""
         if self.player_id and self.player_id in self.players:
@@ -145,7 +320,7 @@ class GameClient:
 
     def draw_panel(self, title: str, y: int, height: int) -> None:
         """Draw a bordered panel with title."""
-        w = term.width
+        w = self._w
         print(term.move(y, 0) + Theme.BORDER("+" + "-" * (w - 2) + "+"))
         print(
             term.move(y + 1, 0)
@@ -178,42 +353,61 @@ class GameClient:
             header = " TRADEWARS 2025 – STARDOCK "
         else:
             header = f" TRADEWARS 2025 – {self.active_window.upper()} "
-        print(term.bold_cyan(header.center(term.width)))
+        print(term.bold_cyan(header.center(self._w)))
+
+        self.render_active_window()
+        self.render_input()
 
+    def render_active_window(self) -> None:
+        """Render only the panel of the active window (or the dock)."""
         if self.in_dock:
             self.render_dock()
-        else:
-            if self.active_window == "status":
-                self.render_status()
-            elif self.active_window == "nav":
-                self.render_navigation()
-            elif self.active_window == "comm":
-                self.render_comm()
-            elif self.active_window == "ship":
-                self.render_ship()
-            elif self.active_window == "comp":
-                self.render_computer()
-
-        # INPUT PROMPT
+        elif self.active_window == "status":
+            self.render_status()
+        elif self.active_window == "nav":
+            self.render_navigation()
+        elif self.active_window == "comm":
+            self.render_comm()
+        elif self.active_window == "ship":
+            self.render_ship()
+        elif self.active_window == "comp":
+            self.render_computer()
+
+    def render_input(self) -> None:
+        """Redraw the input prompt line and park the cursor after it."""
         if self.in_dock:
             prompt = "Dock Command > "
         else:
             prompt = f"{self.active_window.capitalize()} Command > "
 
         print(
-            term.move(term.height - 2, 0)
+            term.move(self._h - 2, 0)
+            + term.clear_eol
             + term.bold_green(prompt)
-            + self.current_input
-        )
-
-        print(
-            term.move(
-                term.height - 2, len(prompt) + len(self.current_input)
-            ),
+            + self.current_input,
             end="",
             flush=True,
         )
 
+    def redraw_dirty(self, dirty: int) -> None:
+        """
+        Repaint only the screen regions flagged in ``dirty``.
+
+        Args:
+            dirty: Bitmask of DIRTY_* flags
+        """
+        if dirty == DIRTY_ALL:
+            self.draw_ui()
+            return
+
+        region = DIRTY_DOCK if self.in_dock else WINDOW_REGIONS.get(self.active_window, 0)
+        if dirty & (region | DIRTY_PANEL):
+            self.render_active_window()
+            dirty |= DIRTY_INPUT
+
+        if dirty & DIRTY_INPUT:
+            self.render_input()
+
     # ============================================================
     # UI - WINDOW RENDERERS
     # ============================================================
@@ -270,35 +464,32 @@ class GameClient:
             + Theme.VALUE(str(sector))
         )
 
-        warps = (
-            self.current_sector_data.get("neighbors")
-            or self.current_sector_data.get("warps")
-            or []
-        )
+        view = self.current_sector_view
         print(term.move(6, 4) + Theme.LABEL("Warp Routes:"))
-        if not warps:
-            print(term.move(8, 6) + Theme.INFO("No warp data."))
+        y = 8
+        if not view.warps:
+            print(term.move(y, 6) + Theme.INFO("No warp data."))
+            y += 1
         else:
-            y = 8
-            for w in warps:
+            for w in view.warps:
                 print(term.move(y, 6) + Theme.VALUE(f"→ Sector {w}"))
                 y += 1
 
-        if self.current_sector_data.get("stardock"):
+        if view.stardock:
             print(term.move(y + 1, 4) + Theme.SUCCESS("[Stardock present - type 'dock']"))
-        elif self.current_sector_data.get("has_port"):
-            pn = self.current_sector_data.get("port_name") or "Unnamed Port"
+        elif view.has_port:
+            pn = view.port_name or "Unnamed Port"
             print(term.move(y + 1, 4) + Theme.INFO(f"Port: {pn}"))
 
     def render_comm(self) -> None:
         """Render communications window."""
-        h = max(12, term.height - 4)
+        h = max(12, self._h - 4)
         self.draw_panel("COMMUNICATIONS", 2, h)
         visible = h - 4
         logs = self.messages[-visible:]
         y = 4
         for m in logs:
-            print(term.move(y, 4) + Theme.VALUE(m[: term.width - 8]))
+            print(term.move(y, 4) + Theme.VALUE(m[: self._w - 8]))
             y += 1
 
     def render_ship(self) -> None:
@@ -362,23 +553,23 @@ class GameClient:
 
     def render_dock(self) -> None:
         """Render stardock docking window."""
-        self.draw_panel("STARDOCK // CELESTIAL BAZAAR", 2, term.height - 4)
+        self.draw_panel("STARDOCK // CELESTIAL BAZAAR", 2, self._h - 4)
         y = 4
 
         if self.dock_intro:
             for line in self.dock_intro.split("\n"):
-                if y >= term.height - 6:
+                if y >= self._h - 6:
                     break
-                print(term.move(y, 4) + Theme.INFO(line[: term.width - 8]))
+                print(term.move(y, 4) + Theme.INFO(line[: self._w - 8]))
                 y += 1
             y += 1
 
         print(term.move(y, 4) + Theme.LABEL("Services:"))
         y += 2
         for line in self.dock_menu:
-            if y >= term.height - 6:
+            if y >= self._h - 6:
                 break
-            print(term.move(y, 6) + Theme.VALUE(line[: term.width - 10]))
+            print(term.move(y, 6) + Theme.VALUE(line[: self._w - 10]))
             y += 1
 
         print(term.move(y + 1, 4) + Theme.INFO("Type service number, or 0 to undock."))
@@ -387,49 +578,53 @@ class GameClient:
     # ANIMATIONS
     # ============================================================
 
+    def _animation_frame(self, text: str) -> None:
+        """Draw one animation frame on the middle line only."""
+        print(
+            term.move(self._h // 2, 0) + term.clear_eol + text,
+            end="",
+            flush=True,
+        )
+
+    def _end_animation(self) -> None:
+        """Wipe the animation line and repaint only the panel beneath it."""
+        self._animation_frame("")
+        self.animating = False
+        self.dirty |= DIRTY_PANEL
+
     async def animate_warp(self) -> None:
         """Warp jump animation."""
         self.animating = True
         try:
             for i in range(4):
-                print(term.home + term.clear)
-                line = "*" * (term.width + 4 * i)
-                print(term.move(term.height // 2, 0) + Theme.INFO(line[: term.width]))
+                line = "*" * (self._w + 4 * i)
+                self._animation_frame(Theme.INFO(line[: self._w]))
                 await asyncio.sleep(0.05)
         finally:
-            self.animating = False
-            self.needs_redraw = True
+            self._end_animation()
 
     async def animate_scan(self) -> None:
         """Scanning animation."""
         self.animating = True
         try:
-            for i in range(term.width):
-                print(term.home + term.clear)
-                print(
-                    term.move(term.height // 2, 0)
-                    + Theme.INFO(" " * i + "|")
-                )
+            # Fixed frame count so wide terminals don't stretch the sweep
+            for i in range(SCAN_ANIMATION_STEPS):
+                x = (i * self._w) // SCAN_ANIMATION_STEPS
+                self._animation_frame(Theme.INFO(" " * x + "|"))
                 await asyncio.sleep(0.01)
         finally:
-            self.animating = False
-            self.needs_redraw = True
+            self._end_animation()
 
     async def animate_port(self) -> None:
         """Port access animation."""
         self.animating = True
         try:
             for i in range(4):
-                print(term.home + term.clear)
                 pad = " " * (i * 3)
-                print(
-                    term.move(term.height // 2, 0)
-                    + Theme.VALUE(pad + "[ PORT ACCESS ]")
-                )
+                self._animation_frame(Theme.VALUE(pad + "[ PORT ACCESS ]"))
                 await asyncio.sleep(0.06)
         finally:
-            self.animating = False
-            self.needs_redraw = True
+            self._end_animation()
 
     # ============================================================
     # COMMAND HANDLER
@@ -445,50 +640,25 @@ class GameClient:
         if not cmd:
             return
 
+        head, _, rest = cmd.partition(" ")
+
         # ------------------------------
         # DOCK MODE
         # ------------------------------
         if self.in_dock:
-            # Numbers 0–5 are dock menu actions
-            if cmd in {"0", "1", "2", "3", "4", "5"}:
-                await self.send_dock_action(cmd)
-                return
-
-            # Allow text commands too
-            if cmd in {"leave", "exit", "undock"}:
-                await self.send_dock_action("0")
+            # Numbers 0–5 are dock menu actions; leave/exit/undock map to "0"
+            menu_action = DOCK_MENU_COMMANDS.get(cmd)
+            if menu_action is not None:
+                await self.send_dock_action(menu_action)
                 return
 
             # Stardock service commands (e.g., REPAIR_HULL, BANK_DEPOSIT)
-            if cmd.startswith(("repair", "upgrade", "expand", "bank", "rusty", "gamble")):
-                # Parse command into action and params
-                parts = cmd.split()
-                action = parts[0].upper()
-                
-                # Map common aliases
-                action_map = {
-                    "REPAIR": "REPAIR_HULL",
-                    "UPGRADE": "UPGRADE_SHIELDS",
-                    "EXPAND": "EXPAND_CARGO",
-                    "GAMBLE": "RUSTY_GAMBLE",
-                }
-                action = action_map.get(action, action)
-                
-                # Handle parameterized actions
-                params = {"action": action}
-                if len(parts) > 1:
-                    try:
-                        params["amount"] = int(parts[1])
-                    except ValueError:
-                        self.messages.append("[DOCK] Invalid amount.")
-                        self.needs_redraw = True
-                        return
-                
-                await self.send_dock_action(action)
+            if head.split("_", 1)[0] in DOCK_SERVICE_PREFIXES:
+                await self._dock_service(head, rest)
                 return
 
             self.messages.append("[DOCK] Unknown command. Use numbers 0-5 or type 'help'.")
-            self.needs_redraw = True
+            self.dirty |= DIRTY_COMM
             return
 
         # ------------------------------
@@ -496,99 +666,117 @@ class GameClient:
         # ------------------------------
 
         # Window switching
-        if cmd in ("status", "nav", "comm", "ship", "comp"):
+        if cmd in WINDOW_COMMANDS:
             self.active_window = cmd
-            self.needs_redraw = True
+            self.dirty = DIRTY_ALL
             return
 
-        # Quit
-        if cmd in ("quit", "exit", "q"):
-            self.messages.append("[SYSTEM] Exiting...")
-            self.running = False
-            self.needs_redraw = True
+        handler = self._cmds.get(head)
+        if handler is not None:
+            await handler(rest)
             return
 
-        # Chat
-        if cmd.startswith("say "):
-            await self.send_chat(cmd[4:])
-            self.needs_redraw = True
-            return
+        self.messages.append(f"[SYSTEM] Unknown command: {cmd}")
+        self.dirty |= DIRTY_COMM
 
-        # Warp
-        if cmd.startswith("warp "):
-            parts = cmd.split()
-            if len(parts) < 2:
-                self.messages.append("[SYSTEM] Usage: warp <sector>")
-                self.needs_redraw = True
-                return
+    async def _dock_service(self, head: str, rest: str) -> None:
+        """Send a named stardock service action, e.g. 'bank_deposit 500'."""
+        action = head.upper()
+        action = DOCK_ACTION_ALIASES.get(action, action)
+
+        # Handle parameterized actions
+        params: Dict[str, Any] = {}
+        if rest:
             try:
-                target = int(parts[1])
+                params["amount"] = int(rest.split()[0])
             except ValueError:
-                self.messages.append("[SYSTEM] Invalid sector number.")
-                self.needs_redraw = True
+                self.messages.append("[DOCK] Invalid amount.")
+                self.dirty |= DIRTY_COMM
                 return
 
-            await self.animate_warp()
-            await self.send_warp(target)
-            return
+        await self.send_dock_action(action, params)
 
-        # Scan
-        if cmd.startswith("scan"):
-            parts = cmd.split()
-            sector = None
-            if len(parts) > 1:
-                try:
-                    sector = int(parts[1])
-                except ValueError:
-                    self.messages.append("[SYSTEM] Invalid sector number.")
-                    self.needs_redraw = True
-                    return
+    async def _cmd_quit(self, rest: str) -> None:
+        """Quit the client."""
+        self.messages.append("[SYSTEM] Exiting...")
+        self.running = False
+        self.dirty |= DIRTY_COMM
 
-            await self.animate_scan()
-            await self.send_scan(sector)
+    async def _cmd_say(self, rest: str) -> None:
+        """Chat: say <message>"""
+        if not rest.strip():
+            self.messages.append("[SYSTEM] Usage: say <message>")
+            self.dirty |= DIRTY_COMM
+            return
+        await self.send_chat(rest)
+        self.dirty |= DIRTY_INPUT
+
+    async def _cmd_warp(self, rest: str) -> None:
+        """Movement: warp <sector>"""
+        parts = rest.split()
+        if not parts:
+            self.messages.append("[SYSTEM] Usage: warp <sector>")
+            self.dirty |= DIRTY_COMM
+            return
+        try:
+            target = int(parts[0])
+        except ValueError:
+            self.messages.append("[SYSTEM] Invalid sector number.")
+            self.dirty |= DIRTY_COMM
             return
 
-        # Port trading
-        if cmd.startswith("port"):
-            parts = cmd.split()
-            if len(parts) == 2 and parts[1] == "info":
-                await self.animate_port()
-                await self.send_port_trade("INFO", "fuel", 1)
+        await self.animate_warp()
+        await self.send_warp(target)
+
+    async def _cmd_scan(self, rest: str) -> None:
+        """Scanning: scan [sector]"""
+        parts = rest.split()
+        sector = None
+        if parts:
+            try:
+                sector = int(parts[0])
+            except ValueError:
+                self.messages.append("[SYSTEM] Invalid sector number.")
+                self.dirty |= DIRTY_COMM
                 return
 
-            if len(parts) == 4:
-                action = parts[1]
-                good = parts[2]
-                try:
-                    amt = int(parts[3])
-                except ValueError:
-                    self.messages.append("[SYSTEM] Invalid amount.")
-                    self.needs_redraw = True
-                    return
+        await self.animate_scan()
+        await self.send_scan(sector)
 
-                await self.animate_port()
-                await self.send_port_trade(action, good, amt)
+    async def _cmd_port(self, rest: str) -> None:
+        """Port trading: port info | port buy/sell <good> <n>"""
+        parts = rest.split()
+        if parts == ["info"]:
+            await self.animate_port()
+            await self.send_port_trade("INFO", "fuel", 1)
+            return
+
+        if len(parts) == 3:
+            action, good, amount = parts
+            try:
+                amt = int(amount)
+            except ValueError:
+                self.messages.append("[SYSTEM] Invalid amount.")
+                self.dirty |= DIRTY_COMM
                 return
 
-            self.messages.append("[SYSTEM] Usage: port info | port buy/sell <good> <n>")
-            self.needs_redraw = True
+            await self.animate_port()
+            await self.send_port_trade(action, good, amt)
             return
 
-        # Docking
-        if cmd == "dock":
-            await self.send_dock_request()
-            return
+        self.messages.append("[SYSTEM] Usage: port info | port buy/sell <good> <n>")
+        self.dirty |= DIRTY_COMM
 
-        # Debug command
-        if cmd == "debug":
-            self.messages.append(f"[DEBUG] Sector ID: {self.current_sector_id}")
-            self.messages.append(f"[DEBUG] Sector data: {self.current_sector_data}")
-            self.messages.append(f"[DEBUG] Has stardock flag: {self.current_sector_data.get('stardock')}")
-            self.needs_redraw = True
-            return
+    async def _cmd_dock(self, rest: str) -> None:
+        """Docking: dock (when in stardock sector)"""
+        await self.send_dock_request()
 
-        self.messages.append(f"[SYSTEM] Unknown command: {cmd}")
-        self.needs_redraw = True
+    async def _cmd_debug(self, rest: str) -> None:
+        """Debug command: dump current sector info."""
+        self.messages.append(f"[DEBUG] Sector ID: {self.current_sector_id}")
+        self.messages.append(f"[DEBUG] Sector data: {self.current_sector_data}")
+        self.messages.append(f"[DEBUG] Has stardock flag: {self.current_sector_data.get('stardock')}")
+        self.dirty |= DIRTY_COMM
 
     # ============================================================
     # MAIN UI + INPUT LOOP
@@ -600,9 +788,9 @@ class GameClient:
             try:
                 while self.running:
 
-                    if not self.animating and self.needs_redraw:
-                        self.draw_ui()
-                        self.needs_redraw = False
+                    if not self.animating and self.dirty:
+                        self.redraw_dirty(self.dirty)
+                        self.dirty = 0
 
                     prompt = (
                         "Dock Command > " if self.in_dock
@@ -611,7 +799,7 @@ class GameClient:
 
                     print(
                         term.move(
-                            term.height - 2,
+                            self._h - 2,
                             len(prompt) + len(self.current_input),
                         ),
                         end="",
@@ -636,7 +824,7 @@ class GameClient:
 
                             # Redraw only the input line
                             print(
-                                term.move(term.height - 2, 0)
+                                term.move(self._h - 2, 0)
                                 + term.clear_eol
                                 + term.bold_green(prompt)
                                 + self.current_input,
@@ -657,7 +845,7 @@ class GameClient:
                         self.current_input = ""
 
                         await self.handle_command(cmd)
-                        self.needs_redraw = True
+                        self.dirty |= DIRTY_INPUT
 
                         continue
 
@@ -669,7 +857,7 @@ class GameClient:
 
                     # Redraw input line only
                     print(
-                        term.move(term.height - 2, 0)
+                        term.move(self._h - 2, 0)
                         + term.clear_eol
                         + term.bold_green(prompt)
                         + self.current_input,
@@ -684,165 +872,224 @@ class GameClient:
     # NETWORK LOOP
     # ============================================================
 
-    async def network_loop(self) -> None:
-        """Network message receiving and processing loop."""
+    async def receive_loop(self) -> None:
+        """Read raw frames off the socket and queue them for decoding."""
         try:
             async for raw in self.websocket:
-                p = decode_packet(raw)
-                pt = p["type"]
-                payload = p["payload"]
-
-                # Skip heartbeat packets
-                if is_heartbeat(p):
-                    continue
-
-                # Player connected
-                if pt == PLAYER_CONNECT:
-                    pid = payload["player_id"]
-                    self.players.setdefault(pid, {})
-                    if self.player_id is None:
-                        self.player_id = pid
-                    self.messages.append(f"[SYSTEM] Player connected: {pid}")
-                    self.needs_redraw = True
-
-                # Player disconnected
-                elif pt == PLAYER_DISCONNECT:
-                    pid = payload["player_id"]
-                    self.players.pop(pid, None)
-                    self.messages.append(f"[SYSTEM] Player disconnected: {pid}")
-                    self.needs_redraw = True
-
-                # Sector update
-                elif pt == SECTOR_UPDATE:
-                    pid = payload["player_id"]
-                    state = payload["state"]
-                    sector_data = payload["sector_data"]
-                    self.players[pid] = state
-
-                    if pid == self.player_id:
-                        self.current_sector_id = state.get("sector")
-                        self.current_sector_data = sector_data
-                        
-                        # DEBUG: Log sector data
-                        if sector_data.get("stardock"):
-                            self.messages.append(f"[DEBUG] Stardock detected in sector {self.current_sector_id}")
-                        
-                        # Exit dock mode when moving
-                        self.in_dock = False
-                        self.dock_intro = None
-                        self.dock_menu = []
-
-                    self.needs_redraw = True
-
-                # Move rejected
-                elif pt == MOVE_REJECT:
-                    reason = payload.get("reason", "Unknown reason")
-                    self.messages.append(f"[SYSTEM] Move rejected: {reason}")
-                    self.needs_redraw = True
-
-                # Chat message
-                elif pt == CHAT_MESSAGE:
-                    pid = payload.get("player_id", "Unknown")
-                    msg = payload["message"]
-                    self.messages.append(f"[{pid}] {msg}")
-                    self.needs_redraw = True
-
-                # Scan result
-                elif pt == SCAN_RESULT:
-                    if payload.get("success"):
-                        self.current_sector_data = payload.get("data", {})
-                        self.messages.append("[SCAN] Scan complete.")
-                    else:
-                        self.messages.append(
-                            f"[SCAN] Failed: {payload.get('message')}"
-                        )
-                    self.needs_redraw = True
-
-                # Trade result
-                elif pt == TRADE_RESULT:
-                    success = payload.get("success", False)
-                    msg = payload.get("message", "")
-                    status = Theme.SUCCESS("OK") if success else Theme.ERROR("FAIL")
-                    self.messages.append(f"[PORT] {status}: {msg}")
-
-                    # Update player state
-                    ps = payload.get("player_state")
-                    if ps and self.player_id:
-                        self.players[self.player_id] = ps
-
-                    self.needs_redraw = True
-
-                # Dock result
-                elif pt == DOCK_RESULT:
-                    if payload.get("exit"):
-                        # Server told us to undock
-                        self.in_dock = False
-                        self.dock_intro = None
-                        self.dock_menu = []
-                        msg = payload.get("message")
-                        if msg:
-                            self.messages.append(f"[DOCK] {msg}")
-                        self.needs_redraw = True
-                        continue
-
-                    if payload.get("success"):
-                        self.in_dock = True
-                        self.dock_intro = payload.get("intro", "")
-                        self.dock_menu = payload.get("menu", [])
-                        self.messages.append("[DOCK] Docking successful.")
-                    else:
-                        self.messages.append(f"[DOCK] {payload.get('message')}")
-                    self.needs_redraw = True
-
-                # Dock action result
-                elif pt == DOCK_ACTION:
-                    msg = payload.get("message")
-                    if msg:
-                        self.messages.append(f"[DOCK] {msg}")
-                    
-                    # Handle multi-line responses
-                    lines = payload.get("lines", [])
-                    for line in lines:
-                        if line:  # Skip empty lines
-                            self.messages.append(f"[DOCK] {line}")
-                    
-                    # Update menu if provided
-                    menu = payload.get("menu")
-                    if isinstance(menu, list):
-                        self.dock_menu = menu
-                    
-                    # Update player state if provided
-                    ps = payload.get("player_state")
-                    if ps and self.player_id:
-                        self.players[self.player_id] = ps
-                    
-                    self.needs_redraw = True
-
-                # Trim message history
-                if len(self.messages) > self.max_messages:
-                    self.messages = self.messages[-self.max_messages:]
-
+                self._recv_raw_q.put_nowait(raw)
         except websockets.ConnectionClosed:
             self.messages.append("[SYSTEM] Connection closed.")
             self.running = False
-            self.needs_redraw = True
+            self.dirty |= DIRTY_COMM
+        finally:
+            # Wake the decoder so it can shut down
+            self._recv_raw_q.put_nowait(None)
+
+    async def network_loop(self) -> None:
+        """
+        Network message processing loop.
+
+        Drains every frame queued by receive_loop, decodes the batch in a
+        worker thread so large payloads don't stall input and redraws,
+        then applies the packets in arrival order.
+        """
+        queue = self._recv_raw_q
+        try:
+            while True:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                closed = batch[-1] is None
+                if closed:
+                    batch.pop()
+
+                if batch:
+                    packets, bad = await asyncio.to_thread(_decode_batch, batch)
+                    if bad:
+                        self.messages.append(f"[SYSTEM] Dropped {bad} malformed packet(s).")
+                        self.dirty |= DIRTY_COMM
+                    for p in packets:
+                        self.handle_packet(p)
+
+                    # Trim message history
+                    if len(self.messages) > self.max_messages:
+                        self.messages = self.messages[-self.max_messages:]
+
+                if closed:
+                    return
+
         except Exception as e:
             self.messages.append(f"[SYSTEM] Network error: {e}")
             self.running = False
-            self.needs_redraw = True
+            self.dirty |= DIRTY_COMM
+            # Close the socket so receive_loop ends and gather() can return
+            await self.websocket.close()
+
+    def handle_packet(self, p: Dict[str, Any]) -> None:
+        """
+        Apply a decoded server packet to client state.
+
+        Args:
+            p: Decoded packet with 'type' and 'payload' keys
+        """
+        pt = p["type"]
+        payload = p["payload"]
+
+        # Player connected
+        if pt == PLAYER_CONNECT:
+            pid = payload["player_id"]
+            self.players.setdefault(pid, {})
+            if self.player_id is None:
+                self.player_id = pid
+            self.messages.append(f"[SYSTEM] Player connected: {pid}")
+            self.dirty |= DIRTY_COMM
+
+        # Player disconnected
+        elif pt == PLAYER_DISCONNECT:
+            pid = payload["player_id"]
+            self.players.pop(pid, None)
+            self.messages.append(f"[SYSTEM] Player disconnected: {pid}")
+            self.dirty |= DIRTY_COMM
+
+        # Sector update
+        elif pt == SECTOR_UPDATE:
+            pid = payload["player_id"]
+            state = payload["state"]
+            sector_data = payload["sector_data"]
+            self.players[pid] = state
+
+            if pid == self.player_id:
+                self.current_sector_id = state.get("sector")
+                self.current_sector_data = sector_data
+                self.current_sector_view = SectorView.from_data(
+                    sector_data, self.current_sector_id
+                )
+                
+                # DEBUG: Log sector data
+                if self.current_sector_view.stardock:
+                    self.messages.append(f"[DEBUG] Stardock detected in sector {self.current_sector_id}")
+                
+                # Exit dock mode when moving
+                if self.in_dock:
+                    self.dirty = DIRTY_ALL
+                self.in_dock = False
+                self.dock_intro = None
+                self.dock_menu = []
+
+                self.dirty |= DIRTY_STATUS | DIRTY_NAV | DIRTY_COMM
+
+        # Move rejected
+        elif pt == MOVE_REJECT:
+            reason = payload.get("reason", "Unknown reason")
+            self.messages.append(f"[SYSTEM] Move rejected: {reason}")
+            self.dirty |= DIRTY_COMM
+
+        # Chat message
+        elif pt == CHAT_MESSAGE:
+            pid = payload.get("player_id", "Unknown")
+            msg = payload["message"]
+            self.messages.append(f"[{pid}] {msg}")
+            self.dirty |= DIRTY_COMM
+
+        # Scan result
+        elif pt == SCAN_RESULT:
+            if payload.get("success"):
+                self.current_sector_data = payload.get("data", {})
+                self.current_sector_view = SectorView.from_data(
+                    self.current_sector_data, payload.get("sector")
+                )
+                self.messages.append("[SCAN] Scan complete.")
+                self.dirty |= DIRTY_NAV
+            else:
+                self.messages.append(
+                    f"[SCAN] Failed: {payload.get('message')}"
+                )
+            self.dirty |= DIRTY_COMM
+
+        # Trade result
+        elif pt == TRADE_RESULT:
+            success = payload.get("success", False)
+            msg = payload.get("message", "")
+            status = Theme.SUCCESS("OK") if success else Theme.ERROR("FAIL")
+            self.messages.append(f"[PORT] {status}: {msg}")
+
+            # Update player state
+            ps = payload.get("player_state")
+            if ps and self.player_id:
+                self.players[self.player_id] = ps
+                self.dirty |= DIRTY_STATUS
+
+            self.dirty |= DIRTY_COMM
+
+        # Dock result
+        elif pt == DOCK_RESULT:
+            if payload.get("exit"):
+                # Server told us to undock
+                self.in_dock = False
+                self.dock_intro = None
+                self.dock_menu = []
+                msg = payload.get("message")
+                if msg:
+                    self.messages.append(f"[DOCK] {msg}")
+                self.dirty = DIRTY_ALL
+                return
+
+            if payload.get("success"):
+                self.in_dock = True
+                self.dock_intro = payload.get("intro", "")
+                self.dock_menu = payload.get("menu", [])
+                self.messages.append("[DOCK] Docking successful.")
+                self.dirty = DIRTY_ALL
+            else:
+                self.messages.append(f"[DOCK] {payload.get('message')}")
+                self.dirty |= DIRTY_COMM
+
+        # Dock action result
+        elif pt == DOCK_ACTION:
+            msg = payload.get("message")
+            if msg:
+                self.messages.append(f"[DOCK] {msg}")
+            
+            # Handle multi-line responses
+            lines = payload.get("lines", [])
+            for line in lines:
+                if line:  # Skip empty lines
+                    self.messages.append(f"[DOCK] {line}")
+            
+            # Update menu if provided
+            menu = payload.get("menu")
+            if isinstance(menu, list):
+                self.dock_menu = menu
+                self.dirty |= DIRTY_DOCK
+            
+            # Update player state if provided
+            ps = payload.get("player_state")
+            if ps and self.player_id:
+                self.players[self.player_id] = ps
+                self.dirty |= DIRTY_STATUS
+            
+            self.dirty |= DIRTY_COMM
 
     # ============================================================
-    # HEARTBEAT LOOP
+    # HEARTBEAT
     # ============================================================
 
-    async def heartbeat_loop(self) -> None:
-        """Periodic heartbeat to keep connection alive."""
-        while self.running and self.websocket:
-            try:
-                await self.send_heartbeat()
-            except Exception:
-                pass
-            await asyncio.sleep(10)
+    def _schedule_hb(self) -> None:
+        """Fire a heartbeat and re-arm the timer while connected."""
+        if not (self.running and self.websocket):
+            return
+        self._hb_task = asyncio.create_task(self._heartbeat())
+        self._hb_handle = asyncio.get_running_loop().call_later(
+            HEARTBEAT_INTERVAL, self._schedule_hb
+        )
+
+    async def _heartbeat(self) -> None:
+        """Send one heartbeat, ignoring failures (the receive loop reports them)."""
+        try:
+            await self.send_heartbeat()
+        except Exception:
+            pass
 
     # ============================================================
     # ENTRY POINT
@@ -850,13 +1097,32 @@ class GameClient:
 
     async def run(self) -> None:
         """Connect to server and run client."""
-        async with websockets.connect(self.uri) as ws:
-            self.websocket = ws
-            await asyncio.gather(
-                self.main_loop(),
-                self.network_loop(),
-                self.heartbeat_loop(),
-            )
+        # SIGWINCH is POSIX-only; on Windows the size stays as cached.
+        # Registered on the loop so the handler runs between tasks rather
+        # than interrupting a redraw mid-frame.
+        loop = asyncio.get_running_loop()
+        resize_sig = getattr(signal, "SIGWINCH", None)
+        if resize_sig is not None:
+            loop.add_signal_handler(resize_sig, self._on_resize)
+
+        self._recv_raw_q = asyncio.Queue()
+
+        try:
+            async with websockets.connect(self.uri) as ws:
+                self.websocket = ws
+                self._schedule_hb()
+                try:
+                    await asyncio.gather(
+                        self.main_loop(),
+                        self.receive_loop(),
+                        self.network_loop(),
+                    )
+                finally:
+                    if self._hb_handle is not None:
+                        self._hb_handle.cancel()
+        finally:
+            if resize_sig is not None:
+                loop.remove_signal_handler(resize_sig)
 
 
 if __name__ == "__main__":
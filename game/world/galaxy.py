@@ -9,15 +9,55 @@ The galaxy consists of interconnected sectors with various features:
 - Future: planets, anomalies, NPCs
 """
 
+import json
+import logging
 import random
-from typing import Dict, Optional, Any
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Any
 from game.world.port import Port
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Galaxy.to_dict layout; saves without a version tag are the v1
+# per-sector-dict format and still load
+SAVE_FORMAT_VERSION = 2
+
 
 # ============================================================
 # SECTOR
 # ============================================================
 
+def _clean_neighbors(raw: List[Any]) -> List[int]:
+    """
+    Coerce saved warp route ids to ints, dropping any that can't be.
+    
+    The adjacency index packs neighbors into an int array and sorts them,
+    so a single stray "2", 2.0 or null would otherwise fail the whole load.
+    
+    Args:
+        raw: Neighbor list as read from a save file
+        
+    Returns:
+        List of integer sector IDs, in saved order
+    """
+    out = []
+    for v in raw:
+        if type(v) is int:
+            out.append(v)
+            continue
+        try:
+            out.append(int(v))
+        except (TypeError, ValueError):
+            logger.warning("Dropping invalid warp route %r", v)
+    return out
+
+
 class Sector:
     """
     Represents a single sector in the galaxy.
@@ -29,6 +69,8 @@ class Sector:
         planet: Planet data (future expansion)
         is_stardock: Whether this sector contains a stardock
     """
+
+    __slots__ = ("id", "neighbors", "port", "planet", "is_stardock")
     
     def __init__(self, sector_id: int):
         """
@@ -69,36 +111,89 @@ class Sector:
             
         Returns:
             Populated sector object
+            
+        Raises:
+            ValueError: If the saved data can't be read as a sector
         """
-        # Validate input
-        if not isinstance(sec_data, dict):
-            raise ValueError("Sector data must be a dictionary")
-        
-        # Restore neighbors (warp routes)
-        if "neighbors" in sec_data:
-            if isinstance(sec_data["neighbors"], list):
-                sector_obj.neighbors = sec_data["neighbors"]
-            else:
-                sector_obj.neighbors = []
-
-        # Restore planets (future expansion)
-        if "planet" in sec_data:
-            sector_obj.planet = sec_data["planet"]
-
-        # Restore ports
-        if sec_data.get("port"):
+        # Saved data is nearly always well formed, so load it straight
+        # through and only sort out garbage when something blows up
+        try:
+            _get = sec_data.get
+            neighbors = _get("neighbors")
+            planet = _get("planet")
+            port_data = _get("port")
+            is_stardock = bool(_get("stardock", False))
+        except AttributeError as e:
+            raise ValueError(f"Invalid sector data: {e}") from e
+
+        neighbors = _clean_neighbors(neighbors) if isinstance(neighbors, list) else []
+
+        # A bad port only costs the port, not the rest of the sector
+        port = None
+        if port_data:
             try:
-                sector_obj.port = Port.from_dict(sec_data["port"])
+                port = Port.from_dict(port_data)
             except Exception as e:
-                print(f"[WARNING] Failed to load port in sector {sector_obj.id}: {e}")
-                sector_obj.port = None
+                logger.warning("Failed to load port in sector %s: %s", sector_obj.id, e)
 
-        # Restore stardock flag - ensure boolean conversion
-        sector_obj.is_stardock = bool(sec_data.get("stardock", False))
+        sector_obj.neighbors = neighbors
+        sector_obj.planet = planet
+        sector_obj.port = port
+        sector_obj.is_stardock = is_stardock
 
         return sector_obj
 
 
+def _build_sectors(n: int) -> Dict[int, Sector]:
+    """
+    Create sectors 1..n in one tight loop.
+    
+    Skips Sector.__init__ and gives every sector the same empty tuple as a
+    neighbors placeholder; generate_warps (or a loader) assigns the real
+    lists straight after, so no per-sector empty list is allocated.
+    
+    Args:
+        n: Number of sectors to create
+        
+    Returns:
+        Dictionary mapping sector ID to a blank Sector
+    """
+    make = object.__new__
+    out = {}
+    for i in range(1, n + 1):
+        s = make(Sector)
+        s.id = i
+        s.neighbors = ()
+        s.port = None
+        s.planet = None
+        s.is_stardock = False
+        out[i] = s
+    return out
+
+
+# ============================================================
+# JSON ENCODING
+# ============================================================
+
+def _json_default(o: Any) -> Dict[str, Any]:
+    """Encode world objects met while dumping a galaxy save."""
+    if isinstance(o, Port):
+        return o.to_dict()
+    if isinstance(o, Sector):
+        return o.to_dict()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class GalaxyEncoder(json.JSONEncoder):
+    """Stdlib JSON encoder that understands Port and Sector objects."""
+
+    def default(self, o: Any) -> Any:
+        try:
+            return _json_default(o)
+        except TypeError:
+            return super().default(o)
+
+
 # ============================================================
 # GALAXY
 # ============================================================
@@ -110,6 +205,10 @@ class Galaxy:
     Attributes:
         size: Total number of sectors
         sectors: Dictionary mapping sector ID to Sector object
+    
+    Warp routes are also packed into a CSR-style adjacency index
+    (_nbr_flat/_nbr_off) for fast lookups; Sector.neighbors stays the
+    source of truth and _pack_adjacency() must be re-run after edits.
     """
     
     def __init__(self, size: int = 200):
@@ -120,14 +219,18 @@ class Galaxy:
             size: Number of sectors in the galaxy (default: 200)
         """
         self.size = size
-        self.sectors: Dict[int, Sector] = {
-            i: Sector(i) for i in range(1, size + 1)
-        }
+        self.sectors: Dict[int, Sector] = _build_sectors(size)
 
         # ALWAYS place stardock in sector 2 BEFORE generating ports
         if 2 in self.sectors:
             self.sectors[2].is_stardock = True
-            print(f"[GALAXY] Stardock initialized in sector 2")
+            logger.info("Stardock initialized in sector 2")
+
+        self._nbr_flat = array("i")
+        self._nbr_off = array("i", [0] * (size + 1))
+
+        # Client-facing sector dicts, built lazily by serialize_sector
+        self._sector_view_cache: Dict[int, Dict[str, Any]] = {}
 
         self.generate_warps()
         self.generate_ports()
@@ -135,7 +238,7 @@ class Galaxy:
         # Double-check sector 2 doesn't have a port (stardock exclusive)
         if 2 in self.sectors:
             if self.sectors[2].port is not None:
-                print(f"[WARNING] Removing port from stardock sector 2")
+                logger.warning("Removing port from stardock sector 2")
                 self.sectors[2].port = None
 
     # ------------------------------------------------------------
@@ -149,14 +252,39 @@ class Galaxy:
         Each sector gets 2-4 random warp connections to other sectors,
         creating a connected graph for navigation.
         """
-        for i in range(1, self.size + 1):
+        n = self.size
+        others = range(1, n)  # n - 1 candidate destinations per sector
+        flat = array("i")
+        off = array("i", [0])
+
+        for i in range(1, n + 1):
             warp_count = random.randint(2, 4)
             
-            # Select random destinations (excluding self)
-            possible_destinations = [x for x in range(1, self.size + 1) if x != i]
-            choices = random.sample(possible_destinations, min(warp_count, len(possible_destinations)))
+            # Select random destinations (excluding self) without building
+            # an exclusion list: sample from 1..n-1, then shift ids >= i up
+            # by one so sector i itself can never be drawn.
+            choices = [x + (x >= i) for x in random.sample(others, min(warp_count, n - 1))]
             
             self.sectors[i].neighbors = choices
+            flat.extend(sorted(choices))
+            off.append(len(flat))
+
+        self._nbr_flat = flat
+        self._nbr_off = off
+
+    def _pack_adjacency(self) -> None:
+        """
+        Rebuild the CSR adjacency index from each Sector.neighbors list.
+        
+        Sector i's sorted neighbors live in _nbr_flat[_nbr_off[i-1]:_nbr_off[i]].
+        """
+        flat = array("i")
+        off = array("i", [0])
+        for i in range(1, self.size + 1):
+            flat.extend(sorted(self.sectors[i].neighbors))
+            off.append(len(flat))
+        self._nbr_flat = flat
+        self._nbr_off = off
 
     # ------------------------------------------------------------
     # Port generation
@@ -171,12 +299,15 @@ class Galaxy:
         """
         port_count = max(1, self.size // 5)  # At least 1 port
         
-        # Select random sectors for ports (excluding sector 2 - stardock)
-        available_sectors = [s for s in range(1, self.size + 1) if s != 2]
-        choices = random.sample(available_sectors, min(port_count, len(available_sectors)))
+        # Select random sectors for ports (excluding sector 2 - stardock).
+        # Sampling one extra id straight from the range and dropping 2 keeps
+        # the pick uniform without materializing an exclusion list.
+        pool = range(1, self.size + 1)
+        drawn = random.sample(pool, min(port_count + 1, len(pool)))
+        choices = [s for s in drawn if s != 2][:port_count]
 
-        for sid in choices:
-            self.sectors[sid].port = Port()
+        for sid, port in zip(choices, Port.random_batch(len(choices))):
+            self.sectors[sid].port = port
 
     # ------------------------------------------------------------
     # Serialization
@@ -186,14 +317,84 @@ class Galaxy:
         """
         Serialize entire galaxy to dictionary for saving.
         
+        Uses the compact v2 layout: warp routes are one flat list plus
+        per-sector offsets, and only sectors that actually have a port,
+        planet or stardock are listed. Sectors in default state cost
+        nothing beyond their warp routes.
+        
         Returns:
             Dictionary containing galaxy size and all sector data
         """
+        data = self._save_layout()
+        data["ports"] = {sid: port.to_dict() for sid, port in data["ports"].items()}
+        return data
+
+    def _save_layout(self) -> Dict[str, Any]:
+        """
+        Build the v2 save layout, leaving Port objects in place.
+        
+        to_dict converts the ports itself; to_json_bytes hands them to the
+        JSON encoder instead so no intermediate port dicts are kept.
+        """
+        flat = []
+        off = [0]
+        ports = {}
+        planets = {}
+        stardocks = []
+
+        for sid in range(1, self.size + 1):
+            s = self.sectors[sid]
+            flat.extend(s.neighbors)
+            off.append(len(flat))
+            if s.port is not None:
+                ports[sid] = s.port
+            if s.planet is not None:
+                planets[sid] = s.planet
+            if s.is_stardock:
+                stardocks.append(sid)
+
         return {
+            "version": SAVE_FORMAT_VERSION,
             "size": self.size,
-            "sectors": {sid: s.to_dict() for sid, s in self.sectors.items()}
+            "csr_off": off,
+            "csr_flat": flat,
+            "ports": ports,
+            "planets": planets,
+            "stardocks": stardocks,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize entire galaxy straight to JSON bytes for saving.
+        
+        Uses orjson when available, falling back to the stdlib encoder.
+        
+        Returns:
+            UTF-8 encoded, 2-space indented JSON document
+        """
+        layout = self._save_layout()
+        if orjson is not None:
+            return orjson.dumps(
+                layout,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        return json.dumps(layout, cls=GalaxyEncoder, indent=2).encode("utf-8")
+
+    @staticmethod
+    def from_json_bytes(buf: bytes) -> "Galaxy":
+        """
+        Restore galaxy from JSON bytes produced by to_json_bytes.
+        
+        Args:
+            buf: Raw JSON document
+            
+        Returns:
+            Restored Galaxy instance
+        """
+        data = orjson.loads(buf) if orjson is not None else json.loads(buf)
+        return Galaxy.from_dict(data)
+
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Galaxy":
         """
@@ -204,10 +405,21 @@ class Galaxy:
             
         Returns:
             Restored Galaxy instance
+            
+        Raises:
+            ValueError: If data is malformed or has an unknown save version
         """
         if not isinstance(data, dict):
             raise ValueError("Galaxy data must be a dictionary")
+
+        # No version key means a v1 save; anything else must match exactly
+        version = data.get("version")
+        if version is not None:
+            if type(version) is not int or version != SAVE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported galaxy save version: {version!r}")
+            return Galaxy._from_compact(data)
         
+        # v1 (per-sector dict) saves below
         # Backward compatibility — infer size if missing
         if "size" in data:
             size = data["size"]
@@ -231,9 +443,59 @@ class Galaxy:
                 if sid_int in g.sectors:
                     Sector.from_dict(sec_data, g.sectors[sid_int])
             except (ValueError, TypeError) as e:
-                print(f"[WARNING] Failed to load sector {sid}: {e}")
+                logger.warning("Failed to load sector %s: %s", sid, e)
                 continue
 
+        g._pack_adjacency()
+        g.invalidate_sector()
+        return g
+
+    @staticmethod
+    def _from_compact(data: Dict[str, Any]) -> "Galaxy":
+        """
+        Restore galaxy from the compact v2 layout written by to_dict.
+        
+        Args:
+            data: Saved galaxy data dictionary (version 2)
+            
+        Returns:
+            Restored Galaxy instance
+            
+        Raises:
+            ValueError: If the warp route arrays don't match the size
+        """
+        size = data["size"]
+        off = data.get("csr_off") or [0] * (size + 1)
+        flat = data.get("csr_flat") or []
+        if (
+            len(off) != size + 1
+            or off[-1] != len(flat)
+            or any(type(o) is not int for o in off)
+        ):
+            raise ValueError("Galaxy warp route data does not match its size")
+
+        # JSON turns int keys into strings
+        ports = {int(k): v for k, v in data.get("ports", {}).items()}
+        planets = {int(k): v for k, v in data.get("planets", {}).items()}
+        stardocks = set(data.get("stardocks", ()))
+
+        g = Galaxy(size=size)
+
+        for sid, sector in g.sectors.items():
+            sector.neighbors = _clean_neighbors(flat[off[sid - 1]:off[sid]])
+            sector.planet = planets.get(sid)
+            sector.is_stardock = sid in stardocks
+
+            port_data = ports.get(sid)
+            sector.port = None
+            if port_data:
+                try:
+                    sector.port = Port.from_dict(port_data)
+                except Exception as e:
+                    logger.warning("Failed to load port in sector %s: %s", sid, e)
+
+        g._pack_adjacency()
+        g.invalidate_sector()
         return g
 
     # ------------------------------------------------------------
@@ -248,9 +510,10 @@ class Galaxy:
             sid: Sector ID to check
             
         Returns:
-            True if sector exists
+            True if sector exists (ids must be ints; 5.0 would hash to
+            sector 5 but can't index the warp route arrays)
         """
-        return sid in self.sectors
+        return type(sid) is int and sid in self.sectors
 
     def is_adjacent(self, src: int, dst: int) -> bool:
         """
@@ -263,9 +526,11 @@ class Galaxy:
         Returns:
             True if sectors are adjacent (warp connection exists)
         """
-        if src not in self.sectors:
+        if type(src) is not int or type(dst) is not int or src not in self.sectors:
             return False
-        return dst in self.sectors[src].neighbors
+        start, end = self._nbr_off[src - 1], self._nbr_off[src]
+        i = bisect_left(self._nbr_flat, dst, start, end)
+        return i < end and self._nbr_flat[i] == dst
 
     def get_sector(self, sid: int) -> Optional[Sector]:
         """
@@ -294,14 +559,19 @@ class Galaxy:
             sid: Sector ID to serialize
             
         Returns:
-            Dictionary with client-visible sector information
+            Dictionary with client-visible sector information. The dict is
+            cached and shared between calls, so callers must not mutate it.
         """
+        cached = self._sector_view_cache.get(sid)
+        if cached is not None:
+            return cached
+
         if sid not in self.sectors:
             return {}
 
         s = self.sectors[sid]
 
-        return {
+        view = {
             "id": s.id,
             "neighbors": s.neighbors,
             "has_port": s.port is not None,
@@ -309,6 +579,23 @@ class Galaxy:
             "stardock": s.is_stardock,
             "port_name": s.port.name if s.port else None,
         }
+        self._sector_view_cache[sid] = view
+        return view
+
+    def invalidate_sector(self, sid: Optional[int] = None) -> None:
+        """
+        Drop cached client views after a sector changes.
+        
+        Must be called after changing a sector's neighbors, port, planet
+        or stardock flag once the galaxy is live.
+        
+        Args:
+            sid: Sector ID to invalidate, or None to clear every sector
+        """
+        if sid is None:
+            self._sector_view_cache.clear()
+        else:
+            self._sector_view_cache.pop(sid, None)
 
     # ------------------------------------------------------------
     # Statistics and debugging
@@ -321,12 +608,18 @@ class Galaxy:
         Returns:
             Dictionary containing galaxy metrics
         """
-        port_count = sum(1 for s in self.sectors.values() if s.port is not None)
-        stardock_count = sum(1 for s in self.sectors.values() if s.is_stardock)
-        planet_count = sum(1 for s in self.sectors.values() if s.planet is not None)
+        # Single pass over the sectors for all feature counts
+        port_count = stardock_count = planet_count = 0
+        for s in self.sectors.values():
+            if s.port is not None:
+                port_count += 1
+            if s.is_stardock:
+                stardock_count += 1
+            if s.planet is not None:
+                planet_count += 1
         
         # Calculate average connections
-        total_connections = sum(len(s.neighbors) for s in self.sectors.values())
+        total_connections = self._nbr_off[-1]
         avg_connections = total_connections / len(self.sectors) if self.sectors else 0
 
         return {
@@ -9,9 +9,11 @@ Ports are commercial stations that buy and sell commodities:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+import logging
 import random
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------
 # Commodity Definitions
@@ -19,6 +21,11 @@ from typing import Dict, Any
 
 COMMODITIES = ["fuel", "ore", "equipment"]
 
+# Fixed commodity slots, used for bitmasks and table indexing
+FUEL, ORE, EQUIPMENT = range(len(COMMODITIES))
+COMMODITY_SLOTS = range(len(COMMODITIES))
+COMMODITY_INDEX = {c: i for i, c in enumerate(COMMODITIES)}
+
 BASE_PRICES = {
     "fuel": 10,
     "ore": 25,
@@ -34,6 +41,92 @@ PORT_TYPES = {
     3: {"fuel": "sell", "ore": "sell", "equipment": "buy"},   # Tech outpost
 }
 
+# Same information as an int per type: bit i set = port SELLS COMMODITIES[i]
+PORT_SELL_MASKS = {
+    type_id: sum(1 << i for i, c in enumerate(COMMODITIES) if modes[c] == "sell")
+    for type_id, modes in PORT_TYPES.items()
+}
+
+
+def _compute_price(base: int, mode: str, level: int) -> int:
+    """
+    Price of one commodity unit at a given stock level.
+    
+    Port pricing follows supply/demand:
+    - Ports that BUY: Higher stock = lower buy price
+    - Ports that SELL: Lower stock = higher sell price
+    """
+    # Dynamic pricing based on mode
+    if mode == "sell":
+        # Port sells to players: low stock = expensive
+        factor = 0.6 + (100 - level) / 150.0
+    else:  # "buy"
+        # Port buys from players: high stock = cheap
+        factor = 1.0 + level / 150.0
+
+    # Calculate price with minimum floor
+    return max(5, int(base * factor))
+
+
+# Stock levels are clamped to 0-100, so every possible price is known up
+# front: _PRICE_TABLE[commodity index][is_sell][level] -> price
+_PRICE_TABLE = tuple(
+    tuple(
+        tuple(_compute_price(BASE_PRICES[c], mode, lvl) for lvl in range(101))
+        for mode in ("buy", "sell")
+    )
+    for c in COMMODITIES
+)
+
+# Precomputed so random type selection doesn't rebuild a key list per port
+_PORT_TYPE_IDS = tuple(PORT_TYPES)
+
+# Range new ports draw their starting commodity levels from
+_LEVEL_RANGE = range(20, 81)
+
+_choice = random.choice
+_choices = random.choices
+_randint = random.randint
+
+
+def _build_loader(name: str, expr: str, default: str) -> Any:
+    """
+    Compile a straight-line loader for one per-commodity dict.
+    
+    The commodity list is fixed at import time, so instead of looping over
+    COMMODITIES on every Port.from_dict call the loop is unrolled into
+    generated source, one list slot per commodity.
+    
+    Args:
+        name: Name of the generated function
+        expr: Value expression for a saved entry, with {v} as the raw value
+        default: Value expression for a missing entry, with {c} as the name
+        
+    Returns:
+        Function taking the saved dict and returning a list in
+        COMMODITIES order
+    """
+    entries = "".join(
+        f"        {expr.format(v=f'saved[{c!r}]')} if {c!r} in saved "
+        f"else {default.format(c=c)},\n"
+        for c in COMMODITIES
+    )
+    src = f"def {name}(saved):\n    return [\n{entries}    ]\n"
+    ns: Dict[str, Any] = {"_randint": _randint, "_BASE_PRICES": BASE_PRICES}
+    exec(compile(src, f"<port {name}>", "exec"), ns)
+    return ns[name]
+
+
+# Saved levels are clamped to 0-100; missing ones get a fresh random level
+_load_levels = _build_loader(
+    "_load_levels", "max(0, min(100, int({v})))", "_randint(20, 80)"
+)
+
+# Saved prices floor at 1; missing ones fall back to the base price
+_load_prices = _build_loader(
+    "_load_prices", "max(1, int({v}))", "_BASE_PRICES[{c!r}]"
+)
+
 # Random name tables for procedural generation
 PORT_PREFIXES = [
     "Rigel", "Sigma", "Omega", "Alpha", "Beta", "Tau",
@@ -56,14 +149,13 @@ def random_port_name() -> str:
     Returns:
         Random port name combining prefix and suffix
     """
-    return f"{random.choice(PORT_PREFIXES)} {random.choice(PORT_SUFFIXES)}"
+    return f"{_choice(PORT_PREFIXES)} {_choice(PORT_SUFFIXES)}"
 
 
 # ------------------------------------------------------------
 # Port Object
 # ------------------------------------------------------------
 
-@dataclass
 class Port:
     """
     Full-featured TradeWars-style trading port.
@@ -71,46 +163,111 @@ class Port:
     Attributes:
         name: Port display name
         type_id: Port type (1-3) determining trade behavior
-        commodity_levels: Stock levels for each commodity (0-100)
-        prices: Current prices for each commodity
+        commodity_levels: Stock levels (0-100), indexed like COMMODITIES
+        prices: Current prices, indexed like COMMODITIES
         modes: Buy/sell modes for each commodity (derived from type_id)
+        sell_mask: Bitmask form of modes (bit i set = sells COMMODITIES[i])
     """
 
-    name: str = None
-    type_id: int = None
-    commodity_levels: Dict[str, int] = field(default_factory=lambda: {
-        c: random.randint(20, 80) for c in COMMODITIES
-    })
-    prices: Dict[str, int] = field(default_factory=dict)
-
-    def __post_init__(self):
-        """Initialize port after dataclass construction."""
+    __slots__ = (
+        "name", "type_id", "commodity_levels", "prices", "modes", "sell_mask",
+        "_summary_cache",
+    )
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        type_id: Optional[int] = None,
+        commodity_levels: Optional[Dict[str, int]] = None,
+        prices: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Initialize a port, filling any missing field with random defaults.
+        
+        Args:
+            name: Port display name (random if omitted)
+            type_id: Port type 1-3 (random if omitted)
+            commodity_levels: Stock levels; missing commodities are randomized
+            prices: Current prices (computed from levels if omitted/empty)
+            
+        Raises:
+            ValueError: If type_id is not a known port type
+        """
         # Generate random name if not provided
-        if self.name is None:
-            self.name = random_port_name()
+        self.name = name if name is not None else random_port_name()
 
         # Assign random type if not provided
-        if self.type_id is None:
-            self.type_id = random.choice(list(PORT_TYPES.keys()))
+        if type_id is None:
+            type_id = _choice(_PORT_TYPE_IDS)
+        self.type_id = type_id
+
+        # Validate type_id and set buy/sell modes with a single lookup
+        modes = PORT_TYPES.get(type_id)
+        if modes is None:
+            raise ValueError(f"Invalid port type_id: {type_id}. Must be 1, 2, or 3.")
+        self.modes = modes
+        self.sell_mask = PORT_SELL_MASKS[type_id]
+        self._summary_cache = None
+
+        # Validate commodity levels (clamped, missing ones randomized)
+        if commodity_levels is None:
+            self.commodity_levels = [_randint(20, 80) for _ in COMMODITY_SLOTS]
+        else:
+            self.commodity_levels = _load_levels(commodity_levels)
 
-        # Validate type_id
-        if self.type_id not in PORT_TYPES:
-            raise ValueError(f"Invalid port type_id: {self.type_id}. Must be 1, 2, or 3.")
+        # Generate initial prices if missing (levels are in range by now,
+        # as the price table requires)
+        if prices:
+            self.prices = _load_prices(prices)
+        else:
+            self.update_prices()
 
-        # Set buy/sell modes based on type
-        self.modes = PORT_TYPES[self.type_id]
+    def __eq__(self, other: object) -> bool:
+        """Ports are equal when their saved state matches."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.type_id == other.type_id
+            and self.commodity_levels == other.commodity_levels
+            and self.prices == other.prices
+        )
 
-        # Generate initial prices if missing
-        if not self.prices:
-            self.update_prices()
+    __hash__ = None  # mutable, like the dataclass it replaced
 
-        # Validate commodity levels
-        for commodity in COMMODITIES:
-            if commodity not in self.commodity_levels:
-                self.commodity_levels[commodity] = random.randint(20, 80)
-            else:
-                # Clamp to valid range
-                self.commodity_levels[commodity] = max(0, min(100, self.commodity_levels[commodity]))
+    @staticmethod
+    def random_batch(count: int) -> List["Port"]:
+        """
+        Create many random ports at once.
+        
+        Names, types and commodity levels for the whole batch are drawn
+        with a handful of random.choices calls, and instances are built
+        without going through __init__.
+        
+        Args:
+            count: Number of ports to create
+            
+        Returns:
+            List of freshly generated ports
+        """
+        n_goods = len(COMMODITIES)
+        prefixes = _choices(PORT_PREFIXES, k=count)
+        suffixes = _choices(PORT_SUFFIXES, k=count)
+        type_ids = _choices(_PORT_TYPE_IDS, k=count)
+        levels = _choices(_LEVEL_RANGE, k=count * n_goods)
+
+        ports = []
+        for i in range(count):
+            port = object.__new__(Port)
+            port.name = f"{prefixes[i]} {suffixes[i]}"
+            port.type_id = type_ids[i]
+            port.modes = PORT_TYPES[type_ids[i]]
+            port.sell_mask = PORT_SELL_MASKS[type_ids[i]]
+            port._summary_cache = None
+            port.commodity_levels = levels[i * n_goods:(i + 1) * n_goods]
+            port.update_prices()
+            ports.append(port)
+        return ports
 
     # --------------------------------------------------------
     # Price Logic
@@ -124,20 +281,12 @@ class Port:
         - Ports that BUY: Higher stock = lower buy price
         - Ports that SELL: Lower stock = higher sell price
         """
-        for c in COMMODITIES:
-            base = BASE_PRICES[c]
-            level = self.commodity_levels.get(c, 50)
-
-            # Dynamic pricing based on mode
-            if self.modes[c] == "sell":
-                # Port sells to players: low stock = expensive
-                factor = 0.6 + (100 - level) / 150.0
-            else:  # "buy"
-                # Port buys from players: high stock = cheap
-                factor = 1.0 + level / 150.0
-
-            # Calculate price with minimum floor
-            self.prices[c] = max(5, int(base * factor))
+        levels = self.commodity_levels
+        mask = self.sell_mask
+        self.prices = [
+            _PRICE_TABLE[i][(mask >> i) & 1][levels[i]] for i in COMMODITY_SLOTS
+        ]
+        self._summary_cache = None
 
     def adjust_commodity_level(self, commodity: str, amount: int) -> None:
         """
@@ -147,15 +296,29 @@ class Port:
             commodity: Commodity name
             amount: Amount to adjust (positive or negative)
         """
-        if commodity not in COMMODITIES:
+        i = COMMODITY_INDEX.get(commodity)
+        if i is None:
             raise ValueError(f"Unknown commodity: {commodity}")
         
-        current = self.commodity_levels.get(commodity, 50)
-        new_level = max(0, min(100, current + amount))
-        self.commodity_levels[commodity] = new_level
+        new_level = max(0, min(100, self.commodity_levels[i] + amount))
+        self.commodity_levels[i] = new_level
         
-        # Recalculate prices after level change
-        self.update_prices()
+        # Only this commodity's price depends on its level
+        self.prices[i] = _PRICE_TABLE[i][(self.sell_mask >> i) & 1][new_level]
+        self._summary_cache = None
+
+    def get_price(self, commodity: str) -> Optional[int]:
+        """
+        Get the current price of one commodity.
+        
+        Args:
+            commodity: Commodity name
+            
+        Returns:
+            Current price, or None if the port doesn't trade it
+        """
+        i = COMMODITY_INDEX.get(commodity)
+        return None if i is None else self.prices[i]
 
     def get_commodity_info(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -167,11 +330,11 @@ class Port:
         return {
             commodity: {
                 "mode": self.modes[commodity],
-                "level": self.commodity_levels[commodity],
-                "price": self.prices[commodity],
+                "level": self.commodity_levels[i],
+                "price": self.prices[i],
                 "base_price": BASE_PRICES[commodity],
             }
-            for commodity in COMMODITIES
+            for i, commodity in enumerate(COMMODITIES)
         }
 
     # --------------------------------------------------------
@@ -188,8 +351,8 @@ class Port:
         return {
             "name": self.name,
             "type_id": self.type_id,
-            "commodity_levels": self.commodity_levels,
-            "prices": self.prices,
+            "commodity_levels": dict(zip(COMMODITIES, self.commodity_levels)),
+            "prices": dict(zip(COMMODITIES, self.prices)),
         }
 
     @staticmethod
@@ -210,56 +373,51 @@ class Port:
         if not isinstance(data, dict):
             raise ValueError("Port data must be a dictionary")
 
+        _get = data.get
+
         # Extract basic fields with defaults
-        name = data.get("name", None)
-        type_id = data.get("type_id", None)
-
-        # Validate type_id if provided
-        if type_id is not None and type_id not in PORT_TYPES:
-            print(f"[WARNING] Invalid port type_id {type_id}, assigning random type")
-            type_id = None
-
-        # Create port instance (will auto-generate missing fields)
-        port = Port(
-            name=name,
-            type_id=type_id,
-        )
+        name = _get("name")
+        type_id = _get("type_id")
+
+        # Validate type_id and resolve its modes with one lookup
+        modes = PORT_TYPES.get(type_id)
+        if modes is None:
+            if type_id is not None:
+                logger.warning("Invalid port type_id %s, assigning random type", type_id)
+            type_id = _choice(_PORT_TYPE_IDS)
+            modes = PORT_TYPES[type_id]
+
+        # Build the instance directly: every field is restored below, so
+        # __init__ (random name, levels, prices) would be wasted
+        port = object.__new__(Port)
+        port.name = name if name is not None else random_port_name()
+        port.type_id = type_id
+        port.modes = modes
+        port.sell_mask = PORT_SELL_MASKS[type_id]
+        port._summary_cache = None
 
         # Restore commodity levels with validation
-        if "commodity_levels" in data and isinstance(data["commodity_levels"], dict):
-            port.commodity_levels = {}
-            for commodity in COMMODITIES:
-                if commodity in data["commodity_levels"]:
-                    # Clamp to valid range
-                    level = data["commodity_levels"][commodity]
-                    port.commodity_levels[commodity] = max(0, min(100, int(level)))
-                else:
-                    port.commodity_levels[commodity] = random.randint(20, 80)
+        saved_levels = _get("commodity_levels")
+        if isinstance(saved_levels, dict):
+            levels = _load_levels(saved_levels)
+        elif isinstance(saved_levels, list) and len(saved_levels) == len(COMMODITIES):
+            levels = [max(0, min(100, int(v))) for v in saved_levels]
         else:
             # Generate default levels
-            port.commodity_levels = {c: random.randint(20, 80) for c in COMMODITIES}
+            levels = [_randint(20, 80) for _ in COMMODITY_SLOTS]
+        port.commodity_levels = levels
 
         # Restore prices or recalculate
-        if "prices" in data and isinstance(data["prices"], dict):
-            port.prices = {}
-            for commodity in COMMODITIES:
-                if commodity in data["prices"]:
-                    port.prices[commodity] = max(1, int(data["prices"][commodity]))
-                else:
-                    # Calculate missing price
-                    port.prices[commodity] = BASE_PRICES[commodity]
+        saved_prices = _get("prices")
+        if isinstance(saved_prices, dict):
+            # Missing commodities fall back to their base price
+            port.prices = _load_prices(saved_prices)
+        elif isinstance(saved_prices, list) and len(saved_prices) == len(COMMODITIES):
+            port.prices = [max(1, int(v)) for v in saved_prices]
         else:
             # Recalculate all prices from levels
             port.update_prices()
 
-        # Ensure modes are set
-        if not hasattr(port, "modes") or not port.modes:
-            port.modes = PORT_TYPES[port.type_id]
-
-        # Ensure name exists
-        if port.name is None:
-            port.name = random_port_name()
-
         return port
 
     # --------------------------------------------------------
@@ -282,18 +440,24 @@ class Port:
         """
         Get human-readable trading summary.
         
+        The text is cached until the next price or level change, since
+        players tend to inspect the same port repeatedly.
+        
         Returns:
             Multi-line string describing port trading options
         """
+        if self._summary_cache is not None:
+            return self._summary_cache
+
         lines = [
             f"=== {self.name} (Type {self.type_id}) ===",
             "",
         ]
         
-        for commodity in COMMODITIES:
+        for i, commodity in enumerate(COMMODITIES):
             mode = self.modes[commodity]
-            price = self.prices[commodity]
-            level = self.commodity_levels[commodity]
+            price = self.prices[i]
+            level = self.commodity_levels[i]
             
             if mode == "sell":
                 action = "SELLING"
@@ -305,4 +469,5 @@ class Port:
                 f"{price:4} cr | Stock: {level:3}%"
             )
         
-        return "\n".join(lines)
\ No newline at end of file
+        self._summary_cache = "\n".join(lines)
+        return self._summary_cache
\ No newline at end of file
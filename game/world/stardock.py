@@ -11,43 +11,105 @@ The Celestial Bazaar (Stardock) offers various services:
 """
 
 import random
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional, Tuple
+
+# Stardock's own generator, so rumor, drink and gamble draws don't share
+# state with (or wait on) the global random instance other modules use
+_rng = random.Random()
 
 # ------------------------------------------------------------
 # Response Builder
 # ------------------------------------------------------------
 
+# Shared default for responses without detail lines. The server only
+# encodes responses, so it is never mutated.
+_EMPTY_LIST: List[str] = []
+
+
+class DockResult:
+    """
+    Outcome of a single stardock action.
+    
+    Attributes:
+        success: Whether the action succeeded
+        message: Main status message
+        lines: Additional detail lines (for multi-line responses)
+        player_state: Read-only view of the live player dict, or None when
+            the action changed nothing
+    """
+
+    __slots__ = ("success", "message", "lines", "player_state")
+
+    def __init__(
+        self,
+        success: bool,
+        message: str,
+        lines: List[str],
+        player_state: Optional[Mapping[str, Any]],
+    ) -> None:
+        self.success = success
+        self.message = message
+        self.lines = lines
+        self.player_state = player_state
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the DOCK_ACTION packet payload.
+        
+        Returns:
+            Dict with success, message, lines and player_state keys
+        """
+        return {
+            "success": self.success,
+            "message": self.message,
+            "lines": self.lines,
+            "player_state": self.player_state,
+        }
+
+    def __repr__(self) -> str:
+        """Detailed representation for debugging."""
+        return (
+            f"DockResult(success={self.success}, message={self.message!r}, "
+            f"lines={self.lines}, player_state={self.player_state})"
+        )
+
+
 def _result(
     success: bool,
     message: str,
-    lines: Optional[List[str]] = None,
+    lines: List[str] = _EMPTY_LIST,
     player_state: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
+) -> DockResult:
     """
-    Build standardized response packet for stardock actions.
+    Build standardized response for stardock actions.
     
     Args:
         success: Whether the action succeeded
         message: Main status message
         lines: Additional detail lines (for multi-line responses)
-        player_state: Updated player state dict
+        player_state: Updated player state dict; leave out when the action
+            changed nothing (e.g. it was rejected)
     
     Returns:
-        Response dict matching DOCK_ACTION packet format
+        DockResult whose player_state is a read-only view of the live
+        player dict, not a copy, or None when the client's copy is still
+        current
     """
-    return {
-        "success": success,
-        "message": message,
-        "lines": lines or [],
-        "player_state": player_state or {},
-    }
+    return DockResult(
+        success,
+        message,
+        lines,
+        None if player_state is None else MappingProxyType(player_state),
+    )
 
 
 # ------------------------------------------------------------
-# Rumors for Rusty Nebula
+# Rumors and Drinks for Rusty Nebula
 # ------------------------------------------------------------
 
-RUMORS = [
+RUMORS: Tuple[str, ...] = (
     "A rogue AI ship was spotted near sector 12—likes to hack nav-computers.",
     "A hidden wormhole near sector 17 took a scout ship. Didn't bring it back.",
     "Corporate transport vanished near the rim—pirates or slavers.",
@@ -63,395 +125,646 @@ RUMORS = [
     "Some trader made 50k credits in one run. Either genius or lucky.",
     "Port authorities in sector 88 are suspiciously lax with inspections.",
     "A ghost ship keeps appearing on scanners but vanishes when approached.",
-]
+)
+
+_DRINKS: Tuple[str, ...] = (
+    "Pan-Galactic Gargle Blaster",
+    "Sirius Cybertonic",
+    "Nebula Fizz",
+    "Void Whiskey",
+    "Asteroid Ale",
+)
+
+# Random picks index a power-of-two table with getrandbits instead of going
+# through random.choice's rejection sampling. 256 slots spread a short
+# list's entries to within one slot of each other, plenty fair for bar talk.
+_PICK_BITS: Final = 8
+_getrandbits = _rng.getrandbits
+
+
+def _pick_table(n: int) -> Tuple[int, ...]:
+    """Map every _PICK_BITS-bit random value onto an index below n."""
+    return tuple(i % n for i in range(1 << _PICK_BITS))
+
+
+_RUMOR_IDX = _pick_table(len(RUMORS))
+_DRINK_IDX = _pick_table(len(_DRINKS))
 
 
 # ------------------------------------------------------------
 # Service Pricing and Constants
 # ------------------------------------------------------------
 
+# Player fields the services read, with the values a new player starts
+# with. ensure_player_defaults fills them in once at dock entry so the
+# handlers can index the player dict directly.
+PLAYER_DEFAULTS: Dict[str, int] = {
+    "credits": 0,
+    "bank": 0,
+    "hull": 100,
+    "shields": 10,
+    "holds": 100,
+}
+
 # Corporate Concourse pricing
-HULL_REPAIR_COST = 150
-HULL_REPAIR_AMOUNT = 10
+HULL_REPAIR_COST: Final = 150
+HULL_REPAIR_AMOUNT: Final = 10
+
+SHIELD_UPGRADE_COST: Final = 500
+SHIELD_UPGRADE_AMOUNT: Final = 5
 
-SHIELD_UPGRADE_COST = 500
-SHIELD_UPGRADE_AMOUNT = 5
+CARGO_EXPANSION_COST: Final = 5000
+CARGO_EXPANSION_AMOUNT: Final = 5
+
+# Corporate Concourse responses: messages are format strings parsed once,
+# detail lines are fully constant and shared by every response
+_REPAIR_MSG = "Hull repaired +{}%. Integrity now at {}%.".format
+_REPAIR_LINES: List[str] = [
+    "Nano-welders seal the breaches with surgical precision.",
+    f"Cost: {HULL_REPAIR_COST} credits.",
+]
+_SHIELDS_MSG = f"Shield capacity increased by {SHIELD_UPGRADE_AMOUNT}. Total: {{}}.".format
+_SHIELDS_LINES: List[str] = [
+    "Capacitors hum as the new shield emitters come online.",
+    f"Cost: {SHIELD_UPGRADE_COST} credits.",
+]
+_CARGO_MSG = f"Cargo holds expanded by {CARGO_EXPANSION_AMOUNT}. Total: {{}}.".format
+_CARGO_LINES: List[str] = [
+    "Engineering crews install modular storage units.",
+    "Your ship's mass increases slightly but the extra space is worth it.",
+    f"Cost: {CARGO_EXPANSION_COST} credits.",
+]
 
-CARGO_EXPANSION_COST = 5000
-CARGO_EXPANSION_AMOUNT = 5
+# Interstellar Bank statement lines (format strings parsed once)
+_BANK_BALANCE_LINE = "Bank balance: {:,} credits".format
+_CASH_LINE = "Cash on hand: {:,} credits".format
+_TOTAL_ASSETS_LINE = "Total assets: {:,} credits".format
+_DEPOSIT_MSG = "Deposited {:,} credits.".format
+_WITHDRAW_MSG = "Withdrew {:,} credits.".format
+_DEPOSIT_SHORT_MSG = "Insufficient credits. You have {} credits available.".format
+_WITHDRAW_SHORT_MSG = "Insufficient bank balance. You have {:,} credits in the bank.".format
 
 # Gambling parameters
-GAMBLE_WIN_CHANCE = 50  # 50% chance to win
-GAMBLE_WIN_MULTIPLIER = 2  # Win 2x your bet
+GAMBLE_WIN_CHANCE: Final = 50  # 50% chance to win
+GAMBLE_WIN_MULTIPLIER: Final = 2  # Win 2x your bet
+
+# One random() draw decides a bet; same odds as randint(1, 100) <= chance
+_GAMBLE_WIN_PROB: Final = GAMBLE_WIN_CHANCE / 100.0
+_random = _rng.random
+
+_GAMBLE_WIN_MSG = "YOU WON! The house pays out {:,} credits.".format
+_GAMBLE_WIN_LINE = "You bet {:,} and won {:,} credits!".format
+_GAMBLE_LOSE_MSG = "You lost. The house takes your {:,} credits.".format
+_CREDITS_LINE = "Credits: {:,}".format
+_GAMBLE_SHORT_MSG = "Not enough credits to gamble. You have {} credits.".format
+
+# Rusty Nebula bar
+DRINK_COST: Final = 10
+
+_DRINK_MSG = "You order a {}.".format
+_DRINK_LINES: List[str] = [
+    "The bartender slides it across the counter.",
+    "It tastes like regret and stardust.",
+    f"Cost: {DRINK_COST} credits",
+]
 
 
-# ------------------------------------------------------------
-# Main Stardock Action Processor
-# ------------------------------------------------------------
+@lru_cache(maxsize=32)
+def _insufficient_credits_msg(cost: int, service: str) -> str:
+    """Rejection message for a fixed-price service the player can't afford."""
+    return f"Insufficient credits. {service} costs {cost} credits."
 
-def stardock_process_action(
-    action: str,
-    params: Dict[str, Any],
-    player: Dict[str, Any],
-    galaxy: Any,
-) -> Dict[str, Any]:
+
+def _validate_amount(
+    amount: int,
+    available: int,
+    kind: str,
+    shortfall: Callable[[int], str],
+) -> Optional[DockResult]:
     """
-    Process all stardock service actions.
+    Check a player-chosen amount against the funds it draws from.
     
     Args:
-        action: Action identifier (e.g., "REPAIR_HULL", "BANK_DEPOSIT")
-        params: Additional parameters for the action
-        player: Player state dictionary (modified in-place)
-        galaxy: Galaxy instance (for future features)
+        amount: Requested amount
+        available: Funds the amount comes out of
+        kind: Amount name for the error message (e.g. "deposit")
+        shortfall: Formats the not-enough-funds message from available
     
     Returns:
-        Response dict matching DOCK_ACTION packet format with:
-        - success: bool
-        - message: str
-        - lines: List[str] (optional additional info)
-        - player_state: Dict (updated player state)
+        Error response, or None if the amount is valid
     """
+    if amount <= 0:
+        return _result(
+            False,
+            f"Invalid {kind} amount. Must be greater than 0.",
+        )
+    if available < amount:
+        return _result(False, shortfall(available))
+    return None
 
-    # ==================================================================
-    # CORPORATE CONCOURSE - Ship Maintenance & Upgrades
-    # ==================================================================
 
-    if action == "REPAIR_HULL":
-        """Repair ship hull damage."""
-        current_hull = player.get("hull", 100)
-        
-        # Check if repair is needed
-        if current_hull >= 100:
-            return _result(
-                False,
-                "Hull integrity at maximum. No repairs needed.",
-                player_state=player,
-            )
-        
-        # Check credits
-        if player.get("credits", 0) < HULL_REPAIR_COST:
-            return _result(
-                False,
-                f"Not enough credits. Hull repair costs {HULL_REPAIR_COST} credits.",
-                player_state=player,
-            )
-
-        # Apply repair
-        player["credits"] -= HULL_REPAIR_COST
-        player["hull"] = min(current_hull + HULL_REPAIR_AMOUNT, 100)
-        actual_repair = player["hull"] - current_hull
+# ------------------------------------------------------------
+# Corporate Concourse - Ship Maintenance & Upgrades
+# ------------------------------------------------------------
+
+def _repair_hull(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Repair ship hull damage."""
+    current_hull: int = player["hull"]
 
+    # Check if repair is needed
+    if current_hull >= 100:
         return _result(
-            True,
-            f"Hull repaired +{actual_repair}%. Integrity now at {player['hull']}%.",
-            lines=[
-                "Nano-welders seal the breaches with surgical precision.",
-                f"Cost: {HULL_REPAIR_COST} credits."
-            ],
-            player_state=player,
+            False,
+            "Hull integrity at maximum. No repairs needed.",
         )
 
-    if action == "UPGRADE_SHIELDS":
-        """Upgrade shield capacity."""
-        if player.get("credits", 0) < SHIELD_UPGRADE_COST:
-            return _result(
-                False,
-                f"Insufficient credits. Shield upgrade costs {SHIELD_UPGRADE_COST} credits.",
-                player_state=player,
-            )
-
-        # Apply upgrade
-        player["credits"] -= SHIELD_UPGRADE_COST
-        player["shields"] = player.get("shields", 10) + SHIELD_UPGRADE_AMOUNT
-
+    # Check credits
+    credits: int = player["credits"]
+    if credits < HULL_REPAIR_COST:
         return _result(
-            True,
-            f"Shield capacity increased by {SHIELD_UPGRADE_AMOUNT}. Total: {player['shields']}.",
-            lines=[
-                "Capacitors hum as the new shield emitters come online.",
-                f"Cost: {SHIELD_UPGRADE_COST} credits."
-            ],
-            player_state=player,
+            False,
+            _insufficient_credits_msg(HULL_REPAIR_COST, "Hull repair"),
         )
 
-    if action == "EXPAND_CARGO":
-        """Expand cargo hold capacity."""
-        if player.get("credits", 0) < CARGO_EXPANSION_COST:
-            return _result(
-                False,
-                f"Not enough credits. Cargo expansion costs {CARGO_EXPANSION_COST} credits.",
-                player_state=player,
-            )
+    # Apply repair
+    new_hull = min(current_hull + HULL_REPAIR_AMOUNT, 100)
+    player["credits"] = credits - HULL_REPAIR_COST
+    player["hull"] = new_hull
+    actual_repair = new_hull - current_hull
 
-        # Apply expansion
-        player["credits"] -= CARGO_EXPANSION_COST
-        player["holds"] = player.get("holds", 100) + CARGO_EXPANSION_AMOUNT
+    return _result(
+        True,
+        _REPAIR_MSG(actual_repair, new_hull),
+        lines=_REPAIR_LINES,
+        player_state=player,
+    )
 
+
+def _upgrade_shields(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Upgrade shield capacity."""
+    credits: int = player["credits"]
+    if credits < SHIELD_UPGRADE_COST:
         return _result(
-            True,
-            f"Cargo holds expanded by {CARGO_EXPANSION_AMOUNT}. Total: {player['holds']}.",
-            lines=[
-                "Engineering crews install modular storage units.",
-                "Your ship's mass increases slightly but the extra space is worth it.",
-                f"Cost: {CARGO_EXPANSION_COST} credits."
-            ],
-            player_state=player,
+            False,
+            _insufficient_credits_msg(SHIELD_UPGRADE_COST, "Shield upgrade"),
         )
 
-    # ==================================================================
-    # INTERSTELLAR BANK - Credit Management
-    # ==================================================================
-
-    if action == "BANK_DEPOSIT":
-        """Deposit credits into secure bank account."""
-        amount = params.get("amount", 0)
-
-        # Validate amount
-        if amount <= 0:
-            return _result(
-                False,
-                "Invalid deposit amount. Must be greater than 0.",
-                player_state=player,
-            )
-
-        # Check available credits
-        if player.get("credits", 0) < amount:
-            return _result(
-                False,
-                f"Insufficient credits. You have {player.get('credits', 0)} credits available.",
-                player_state=player,
-            )
-
-        # Process deposit
-        player["credits"] -= amount
-        player["bank"] = player.get("bank", 0) + amount
+    # Apply upgrade
+    shields = player["shields"] + SHIELD_UPGRADE_AMOUNT
+    player["credits"] = credits - SHIELD_UPGRADE_COST
+    player["shields"] = shields
 
-        return _result(
-            True,
-            f"Deposited {amount:,} credits.",
-            lines=[
-                f"Bank balance: {player['bank']:,} credits",
-                f"Cash on hand: {player['credits']:,} credits",
-                "Funds are protected by military-grade encryption."
-            ],
-            player_state=player,
-        )
+    return _result(
+        True,
+        _SHIELDS_MSG(shields),
+        lines=_SHIELDS_LINES,
+        player_state=player,
+    )
 
-    if action == "BANK_WITHDRAW":
-        """Withdraw credits from bank account."""
-        amount = params.get("amount", 0)
-
-        # Validate amount
-        if amount <= 0:
-            return _result(
-                False,
-                "Invalid withdrawal amount. Must be greater than 0.",
-                player_state=player,
-            )
-
-        # Check bank balance
-        bank_balance = player.get("bank", 0)
-        if bank_balance < amount:
-            return _result(
-                False,
-                f"Insufficient bank balance. You have {bank_balance:,} credits in the bank.",
-                player_state=player,
-            )
-
-        # Process withdrawal
-        player["bank"] -= amount
-        player["credits"] = player.get("credits", 0) + amount
 
+def _expand_cargo(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Expand cargo hold capacity."""
+    credits: int = player["credits"]
+    if credits < CARGO_EXPANSION_COST:
         return _result(
-            True,
-            f"Withdrew {amount:,} credits.",
-            lines=[
-                f"Bank balance: {player['bank']:,} credits",
-                f"Cash on hand: {player['credits']:,} credits",
-                "Credits transferred to your ship's vault."
-            ],
-            player_state=player,
+            False,
+            _insufficient_credits_msg(CARGO_EXPANSION_COST, "Cargo expansion"),
         )
 
-    if action == "BANK_BALANCE":
-        """Check bank account balance."""
-        bank_balance = player.get("bank", 0)
-        credits = player.get("credits", 0)
-        total = bank_balance + credits
+    # Apply expansion
+    holds = player["holds"] + CARGO_EXPANSION_AMOUNT
+    player["credits"] = credits - CARGO_EXPANSION_COST
+    player["holds"] = holds
 
-        return _result(
-            True,
-            "Account summary:",
-            lines=[
-                f"Bank balance: {bank_balance:,} credits",
-                f"Cash on hand: {credits:,} credits",
-                f"Total assets: {total:,} credits",
-            ],
-            player_state=player,
-        )
+    return _result(
+        True,
+        _CARGO_MSG(holds),
+        lines=_CARGO_LINES,
+        player_state=player,
+    )
 
-    # ==================================================================
-    # RUSTY NEBULA - Cantina Services
-    # ==================================================================
 
-    if action == "RUSTY_RUMOR":
-        """Hear a random rumor from the cantina."""
-        rumor = random.choice(RUMORS)
-        
-        return _result(
-            True,
-            "A hooded figure leans close and whispers...",
-            lines=[
-                "",
-                f'"{rumor}"',
-                "",
-                "They disappear back into the smoky crowd."
-            ],
-            player_state=player,
-        )
+# ------------------------------------------------------------
+# Interstellar Bank - Credit Management
+# ------------------------------------------------------------
 
-    if action == "RUSTY_GAMBLE":
-        """Gamble credits in a game of chance."""
-        amount = params.get("amount", 0)
-
-        # Validate bet amount
-        if amount <= 0:
-            return _result(
-                False,
-                "Invalid bet amount. Must be greater than 0.",
-                player_state=player,
-            )
-
-        # Check available credits
-        if player.get("credits", 0) < amount:
-            return _result(
-                False,
-                f"Not enough credits to gamble. You have {player.get('credits', 0)} credits.",
-                player_state=player,
-            )
-
-        # Deduct bet
-        player["credits"] -= amount
-
-        # Roll the dice
-        roll = random.randint(1, 100)
-        won = roll <= GAMBLE_WIN_CHANCE
-
-        if won:
-            winnings = amount * GAMBLE_WIN_MULTIPLIER
-            player["credits"] += winnings
-            profit = winnings - amount
-            
-            return _result(
-                True,
-                f"YOU WON! The house pays out {winnings:,} credits.",
-                lines=[
-                    f"You bet {amount:,} and won {profit:,} credits!",
-                    "The dealer nods with grudging respect.",
-                    f"Credits: {player['credits']:,}"
-                ],
-                player_state=player,
-            )
-        else:
-            return _result(
-                False,
-                f"You lost. The house takes your {amount:,} credits.",
-                lines=[
-                    "The cards weren't in your favor this time.",
-                    "The dealer smirks and slides your chips away.",
-                    f"Credits: {player['credits']:,}"
-                ],
-                player_state=player,
-            )
-
-    if action == "RUSTY_DRINKS":
-        """Buy drinks at the cantina (cosmetic/future feature)."""
-        drink_cost = 10
-        
-        if player.get("credits", 0) < drink_cost:
-            return _result(
-                False,
-                "Not enough credits for a drink.",
-                player_state=player,
-            )
-        
-        player["credits"] -= drink_cost
-        
-        drinks = [
-            "Pan-Galactic Gargle Blaster",
-            "Sirius Cybertonic",
-            "Nebula Fizz",
-            "Void Whiskey",
-            "Asteroid Ale",
-        ]
-        
-        drink = random.choice(drinks)
-        
-        return _result(
-            True,
-            f"You order a {drink}.",
-            lines=[
-                "The bartender slides it across the counter.",
-                "It tastes like regret and stardust.",
-                f"Cost: {drink_cost} credits"
-            ],
-            player_state=player,
-        )
+def _bank_deposit(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Deposit credits into secure bank account."""
+    amount: int = params.get("amount", 0)
+    credits: int = player["credits"]
+
+    error = _validate_amount(amount, credits, "deposit", _DEPOSIT_SHORT_MSG)
+    if error:
+        return error
+
+    # Process deposit
+    credits -= amount
+    bank = player["bank"] + amount
+    player["credits"] = credits
+    player["bank"] = bank
+
+    return _result(
+        True,
+        _DEPOSIT_MSG(amount),
+        lines=[
+            _BANK_BALANCE_LINE(bank),
+            _CASH_LINE(credits),
+            "Funds are protected by military-grade encryption."
+        ],
+        player_state=player,
+    )
+
+
+def _bank_withdraw(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Withdraw credits from bank account."""
+    amount: int = params.get("amount", 0)
+    bank_balance: int = player["bank"]
+
+    error = _validate_amount(amount, bank_balance, "withdrawal", _WITHDRAW_SHORT_MSG)
+    if error:
+        return error
+
+    # Process withdrawal
+    bank_balance -= amount
+    credits = player["credits"] + amount
+    player["bank"] = bank_balance
+    player["credits"] = credits
+
+    return _result(
+        True,
+        _WITHDRAW_MSG(amount),
+        lines=[
+            _BANK_BALANCE_LINE(bank_balance),
+            _CASH_LINE(credits),
+            "Credits transferred to your ship's vault."
+        ],
+        player_state=player,
+    )
+
+
+def _bank_balance(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Check bank account balance."""
+    bank_balance: int = player["bank"]
+    credits: int = player["credits"]
+    total = bank_balance + credits
 
-    # ==================================================================
-    # MARKET PROMENADE - Future Feature
-    # ==================================================================
+    return _result(
+        True,
+        "Account summary:",
+        lines=[
+            _BANK_BALANCE_LINE(bank_balance),
+            _CASH_LINE(credits),
+            _TOTAL_ASSETS_LINE(total),
+        ],
+        player_state=player,
+    )
+
+
+# ------------------------------------------------------------
+# Rusty Nebula - Cantina Services
+# ------------------------------------------------------------
+
+# Every possible rumor response, built once and laid out over the same
+# power-of-two table as _RUMOR_IDX so one getrandbits call picks a finished
+# response. A rumor changes nothing, so these carry no player_state and are
+# shared between players as-is (like every response, they are only encoded).
+_RUMOR_RESPONSES: Tuple[DockResult, ...] = tuple(
+    _result(
+        True,
+        "A hooded figure leans close and whispers...",
+        lines=[
+            "",
+            f'"{rumor}"',
+            "",
+            "They disappear back into the smoky crowd.",
+        ],
+    )
+    for rumor in RUMORS
+)
+_RUMOR_POOL: Tuple[DockResult, ...] = tuple(_RUMOR_RESPONSES[i] for i in _RUMOR_IDX)
+
+# Drink orders do change credits, so only their messages are prebuilt
+_DRINK_POOL: Tuple[str, ...] = tuple(_DRINK_MSG(_DRINKS[i]) for i in _DRINK_IDX)
+
+
+def _rusty_rumor(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Hear a random rumor from the cantina."""
+    return _RUMOR_POOL[_getrandbits(_PICK_BITS)]
+
+
+def _rusty_gamble(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Gamble credits in a game of chance."""
+    amount: int = params.get("amount", 0)
+    credits: int = player["credits"]
+
+    error = _validate_amount(amount, credits, "bet", _GAMBLE_SHORT_MSG)
+    if error:
+        return error
+
+    # Deduct bet
+    credits -= amount
+
+    # Roll the dice
+    if _random() < _GAMBLE_WIN_PROB:
+        winnings = amount * GAMBLE_WIN_MULTIPLIER
+        credits += winnings
+        player["credits"] = credits
+        profit = winnings - amount
 
-    if action == "MARKET_BROWSE":
-        """Browse exotic market goods (placeholder)."""
         return _result(
             True,
-            "Market Promenade coming soon!",
+            _GAMBLE_WIN_MSG(winnings),
             lines=[
-                "Exotic goods, rare artifacts, and black market tech.",
-                "Under construction. Check back later."
+                _GAMBLE_WIN_LINE(amount, profit),
+                "The dealer nods with grudging respect.",
+                _CREDITS_LINE(credits),
             ],
             player_state=player,
         )
 
-    # ==================================================================
-    # TECH LAB - Future Feature
-    # ==================================================================
+    player["credits"] = credits
+    return _result(
+        False,
+        _GAMBLE_LOSE_MSG(amount),
+        lines=[
+            "The cards weren't in your favor this time.",
+            "The dealer smirks and slides your chips away.",
+            _CREDITS_LINE(credits),
+        ],
+        player_state=player,
+    )
+
 
-    if action == "TECH_BROWSE":
-        """Browse experimental modifications (placeholder)."""
+def _rusty_drinks(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Buy drinks at the cantina (cosmetic/future feature)."""
+    drink_cost = DRINK_COST
+
+    credits: int = player["credits"]
+    if credits < drink_cost:
         return _result(
-            True,
-            "Tech Lab experimental mods coming soon!",
-            lines=[
-                "Jump drive enhancers, cloaking devices, weapon systems.",
-                "Currently in development. Stand by."
-            ],
-            player_state=player,
+            False,
+            _insufficient_credits_msg(drink_cost, "A drink"),
         )
 
-    # ==================================================================
-    # UNKNOWN ACTION
-    # ==================================================================
+    player["credits"] = credits - drink_cost
 
     return _result(
-        False,
-        f"Unknown Stardock action: '{action}'",
+        True,
+        _DRINK_POOL[_getrandbits(_PICK_BITS)],
+        lines=_DRINK_LINES,
+        player_state=player,
+    )
+
+
+# ------------------------------------------------------------
+# Market Promenade - Future Feature
+# ------------------------------------------------------------
+
+def _market_browse(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Browse exotic market goods (placeholder)."""
+    return _result(
+        True,
+        "Market Promenade coming soon!",
         lines=[
-            "Available actions:",
-            "REPAIR_HULL, UPGRADE_SHIELDS, EXPAND_CARGO",
-            "BANK_DEPOSIT, BANK_WITHDRAW, BANK_BALANCE",
-            "RUSTY_RUMOR, RUSTY_GAMBLE, RUSTY_DRINKS",
+            "Exotic goods, rare artifacts, and black market tech.",
+            "Under construction. Check back later."
         ],
         player_state=player,
     )
 
 
+# ------------------------------------------------------------
+# Tech Lab - Future Feature
+# ------------------------------------------------------------
+
+def _tech_browse(
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """Browse experimental modifications (placeholder)."""
+    return _result(
+        True,
+        "Tech Lab experimental mods coming soon!",
+        lines=[
+            "Jump drive enhancers, cloaking devices, weapon systems.",
+            "Currently in development. Stand by."
+        ],
+        player_state=player,
+    )
+
+
+# ------------------------------------------------------------
+# Unknown Action
+# ------------------------------------------------------------
+
+# Shared by every unknown-action response; _result passes lines through
+# untouched, so nothing may mutate this list
+_UNKNOWN_LINES: List[str] = [
+    "Available actions:",
+    "REPAIR_HULL, UPGRADE_SHIELDS, EXPAND_CARGO",
+    "BANK_DEPOSIT, BANK_WITHDRAW, BANK_BALANCE",
+    "RUSTY_RUMOR, RUSTY_GAMBLE, RUSTY_DRINKS",
+]
+
+
+def _unknown_action(action: str) -> DockResult:
+    """Reject an action no handler is registered for."""
+    return _result(
+        False,
+        f"Unknown Stardock action: '{action}'",
+        lines=_UNKNOWN_LINES,
+    )
+
+
+# ------------------------------------------------------------
+# Main Stardock Action Processor
+# ------------------------------------------------------------
+
+def ensure_player_defaults(player: Dict[str, Any]) -> None:
+    """
+    Fill in any player fields the stardock services rely on.
+    
+    Call once when a player docks, before any stardock_process_action.
+    
+    Args:
+        player: Player state dictionary (modified in-place)
+    """
+    for key, value in PLAYER_DEFAULTS.items():
+        player.setdefault(key, value)
+
+
+# Action identifier -> handler(params, player, galaxy)
+HANDLERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any], Any], DockResult]] = {
+    "REPAIR_HULL": _repair_hull,
+    "UPGRADE_SHIELDS": _upgrade_shields,
+    "EXPAND_CARGO": _expand_cargo,
+    "BANK_DEPOSIT": _bank_deposit,
+    "BANK_WITHDRAW": _bank_withdraw,
+    "BANK_BALANCE": _bank_balance,
+    "RUSTY_RUMOR": _rusty_rumor,
+    "RUSTY_GAMBLE": _rusty_gamble,
+    "RUSTY_DRINKS": _rusty_drinks,
+    "MARKET_BROWSE": _market_browse,
+    "TECH_BROWSE": _tech_browse,
+}
+
+
+def stardock_process_action(
+    action: str,
+    params: Dict[str, Any],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> DockResult:
+    """
+    Process all stardock service actions.
+    
+    Args:
+        action: Action identifier (e.g., "REPAIR_HULL", "BANK_DEPOSIT")
+        params: Additional parameters for the action
+        player: Player state dictionary (modified in-place); must hold
+            every PLAYER_DEFAULTS key, see ensure_player_defaults
+        galaxy: Galaxy instance (for future features)
+    
+    Returns:
+        DockResult (to_dict() gives the DOCK_ACTION payload) with:
+        - success: bool
+        - message: str
+        - lines: List[str] (optional additional info)
+        - player_state: Mapping (updated player state), or None if the
+          action was rejected and nothing changed
+    """
+    handler = HANDLERS.get(action)
+    if handler is None:
+        return _unknown_action(action)
+    return handler(params, player, galaxy)
+
+
+def stardock_process_batch(
+    actions: List[Tuple[str, Dict[str, Any]]],
+    player: Dict[str, Any],
+    galaxy: Any,
+) -> List[DockResult]:
+    """
+    Process several stardock actions for one player in order.
+    
+    Each entry goes through stardock_process_action, so dispatch and
+    unknown-action handling stay in one place. Each action sees the
+    player state left by the ones before it.
+    
+    Args:
+        actions: (action, params) pairs, in the order to apply them
+        player: Player state dictionary (modified in-place); must hold
+            every PLAYER_DEFAULTS key, see ensure_player_defaults
+        galaxy: Galaxy instance (for future features)
+    
+    Returns:
+        One DockResult per action, in the same order
+    """
+    return [
+        stardock_process_action(action, params, player, galaxy)
+        for action, params in actions
+    ]
+
+
 # ------------------------------------------------------------
 # Helper Functions
 # ------------------------------------------------------------
 
-def get_service_menu(service_area: str) -> List[str]:
+# Built once at import; both helpers below hand out these shared objects
+_MENUS: Dict[str, Tuple[str, ...]] = {
+    "corporate": (
+        f"REPAIR_HULL - Repair hull damage ({HULL_REPAIR_COST} credits)",
+        f"UPGRADE_SHIELDS - Increase shield capacity ({SHIELD_UPGRADE_COST} credits)",
+        f"EXPAND_CARGO - Add cargo holds ({CARGO_EXPANSION_COST} credits)",
+    ),
+    "bank": (
+        "BANK_DEPOSIT <amount> - Deposit credits",
+        "BANK_WITHDRAW <amount> - Withdraw credits",
+        "BANK_BALANCE - Check account balance",
+    ),
+    "rusty": (
+        "RUSTY_RUMOR - Hear rumors (free)",
+        "RUSTY_GAMBLE <amount> - Gamble credits",
+        f"RUSTY_DRINKS - Buy a drink ({DRINK_COST} credits)",
+    ),
+    "market": (
+        "MARKET_BROWSE - Browse exotic goods (coming soon)",
+    ),
+    "tech": (
+        "TECH_BROWSE - View experimental mods (coming soon)",
+    ),
+}
+
+_STARDOCK_INFO: Dict[str, Any] = {
+    "name": "Celestial Bazaar Stardock",
+    "description": "Premium services for discerning captains",
+    "services": {
+        "Corporate Concourse": {
+            "description": "Ship upgrades and maintenance",
+            "services": _MENUS["corporate"],
+        },
+        "Interstellar Bank": {
+            "description": "Secure credit storage",
+            "services": _MENUS["bank"],
+        },
+        "Rusty Nebula": {
+            "description": "Cantina and entertainment",
+            "services": _MENUS["rusty"],
+        },
+        "Market Promenade": {
+            "description": "Exotic goods trading",
+            "services": _MENUS["market"],
+        },
+        "Tech Lab": {
+            "description": "Experimental modifications",
+            "services": _MENUS["tech"],
+        },
+    },
+}
+
+
+def get_service_menu(service_area: str) -> Tuple[str, ...]:
     """
     Get available actions for a specific service area.
     
@@ -459,65 +772,18 @@ def get_service_menu(service_area: str) -> List[str]:
         service_area: Service identifier (e.g., "corporate", "bank", "rusty")
     
     Returns:
-        List of available actions for that area
+        Tuple of available actions for that area (empty if unknown)
     """
-    menus = {
-        "corporate": [
-            "REPAIR_HULL - Repair hull damage (150 credits)",
-            "UPGRADE_SHIELDS - Increase shield capacity (500 credits)",
-            "EXPAND_CARGO - Add cargo holds (5000 credits)",
-        ],
-        "bank": [
-            "BANK_DEPOSIT <amount> - Deposit credits",
-            "BANK_WITHDRAW <amount> - Withdraw credits",
-            "BANK_BALANCE - Check account balance",
-        ],
-        "rusty": [
-            "RUSTY_RUMOR - Hear rumors (free)",
-            "RUSTY_GAMBLE <amount> - Gamble credits",
-            "RUSTY_DRINKS - Buy a drink (10 credits)",
-        ],
-        "market": [
-            "MARKET_BROWSE - Browse exotic goods (coming soon)",
-        ],
-        "tech": [
-            "TECH_BROWSE - View experimental mods (coming soon)",
-        ],
-    }
-    
-    return menus.get(service_area.lower(), [])
+    return _MENUS.get(service_area.lower(), ())
 
 
 def get_stardock_info() -> Dict[str, Any]:
     """
     Get general information about Stardock services.
     
+    The same prebuilt dict is returned on every call; treat it as read-only.
+    
     Returns:
         Dict containing service descriptions and pricing
     """
-    return {
-        "name": "Celestial Bazaar Stardock",
-        "description": "Premium services for discerning captains",
-        "services": {
-            "Corporate Concourse": {
-                "description": "Ship upgrades and maintenance",
-                "services": get_service_menu("corporate"),
-            },
-            "Interstellar Bank": {
-                "description": "Secure credit storage",
-                "services": get_service_menu("bank"),
-            },
-            "Rusty Nebula": {
-                "description": "Cantina and entertainment",
-                "services": get_service_menu("rusty"),
-            },
-            "Market Promenade": {
-                "description": "Exotic goods trading",
-                "services": get_service_menu("market"),
-            },
-            "Tech Lab": {
-                "description": "Experimental modifications",
-                "services": get_service_menu("tech"),
-            },
-        },
-    }
\ No newline at end of file
+    return _STARDOCK_INFO